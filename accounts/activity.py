@@ -0,0 +1,69 @@
+"""
+Session Activity Tracking for Prodigy Auth
+Record last-seen times in the cache and write them to UserSession in batches
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from .models import UserSession
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# JWT claim carrying the UserSession.session_key a token was issued for
+SESSION_ID_CLAIM = 'sid'
+
+
+class SessionActivityTracker:
+    """
+    Coalesces per-request activity into periodic bulk_update calls
+
+    touch() costs one cache write per request and remembers the newest
+    timestamp per session in memory. flush() - run every
+    SESSION_ACTIVITY_FLUSH_INTERVAL seconds by the periodic job thread -
+    writes all pending sessions with one SELECT and one bulk_update, so each
+    session is written at most once per interval no matter how busy it is.
+    """
+
+    def __init__(self, flush_interval=None):
+        self.flush_interval = flush_interval or getattr(settings, 'SESSION_ACTIVITY_FLUSH_INTERVAL', 60)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.flushed = 0
+
+    def cache_key(self, session_key):
+        return f'session_activity:{session_key}'
+
+    def touch(self, session_key, now=None):
+        now = now or timezone.now()
+        cache.set(self.cache_key(session_key), now, self.flush_interval * 2)
+        with self._lock:
+            self._pending[session_key] = now
+
+    def last_seen(self, session_keys):
+        """Cached last-seen times (newer than the table) for the given sessions"""
+        cached = cache.get_many([self.cache_key(key) for key in session_keys])
+        return {key: cached[self.cache_key(key)] for key in session_keys if self.cache_key(key) in cached}
+
+    def flush(self):
+        """Write pending activity to UserSession; returns the number of rows updated"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return 0
+
+        sessions = list(UserSession.objects.filter(session_key__in=pending).only('id', 'session_key'))
+        for session in sessions:
+            session.last_activity = pending[session.session_key]
+
+        # bulk_update skips save(), so the timestamps are written as recorded
+        UserSession.objects.bulk_update(sessions, ['last_activity'], batch_size=500)
+        self.flushed += len(sessions)
+        return len(sessions)
+
+
+# Global instance
+session_activity = SessionActivityTracker()
@@ -3,10 +3,17 @@ from django.contrib.auth.admin import UserAdmin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
-from .models import CustomUser
+from django.utils import timezone
+from .models import CustomUser, OutboundEmail
 from .email_service import email_service
+from .lockout import failed_logins
+from .user_cache import user_lookup
+from .outbox import requeue_dead_letters
 import uuid
 
+# Users rendered and dispatched per batch by the bulk verification action
+VERIFICATION_BATCH_SIZE = 1000
+
 @admin.register(CustomUser)
 class CustomUserAdmin(UserAdmin):
     list_display = (
@@ -83,43 +90,91 @@ class CustomUserAdmin(UserAdmin):
     def send_verification_email(self, request, queryset):
         """Send verification email to selected users"""
         count = 0
-        for user in queryset:
-            if not user.is_verified:
-                if not user.verification_token:
-                    user.verification_token = str(uuid.uuid4())
-                    user.save()
-                
-                success = email_service.send_verification_email(user, user.verification_token)
-                if success:
-                    count += 1
+        unverified = queryset.filter(is_verified=False).only(
+            'id', 'email', 'username', 'verification_token', 'verification_token_created'
+        ).order_by('pk')
+        
+        # Walk the selection in primary-key chunks so memory stays flat for large selections
+        last_pk = 0
+        while True:
+            batch = list(unverified.filter(pk__gt=last_pk)[:VERIFICATION_BATCH_SIZE])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            
+            # Assign missing tokens with one UPDATE per batch
+            missing_token = [user for user in batch if not user.verification_token]
+            if missing_token:
+                now = timezone.now()
+                for user in missing_token:
+                    user.verification_token = uuid.uuid4()
+                    user.verification_token_created = now
+                CustomUser.objects.bulk_update(
+                    missing_token, ['verification_token', 'verification_token_created']
+                )
+            
+            count += email_service.send_verification_emails(batch)
         
         self.message_user(request, f'Verification emails sent to {count} users.')
     send_verification_email.short_description = "Send verification emails"
     
     def verify_users(self, request, queryset):
         """Manually verify selected users"""
+        users = list(queryset.only('email', 'username'))
         count = queryset.update(is_verified=True)
+        user_lookup.invalidate_many(users)
         self.message_user(request, f'{count} users verified successfully.')
     verify_users.short_description = "Verify selected users"
     
     def make_admin(self, request, queryset):
         """Make selected users admins"""
+        users = list(queryset.only('email', 'username'))
         count = queryset.update(role='admin')
+        user_lookup.invalidate_many(users)
         self.message_user(request, f'{count} users promoted to admin.')
     make_admin.short_description = "Make admin"
     
     def make_user(self, request, queryset):
         """Make selected users regular users"""
+        users = list(queryset.only('email', 'username'))
         count = queryset.update(role='user')
+        user_lookup.invalidate_many(users)
         self.message_user(request, f'{count} users changed to regular user.')
     make_user.short_description = "Make regular user"
     
     def reset_failed_attempts(self, request, queryset):
         """Reset failed login attempts"""
+        users = list(queryset.only('email', 'username'))
         count = queryset.update(failed_login_attempts=0, account_locked_until=None)
+        user_lookup.invalidate_many(users)
+        failed_logins.reset([user.pk for user in users])
         self.message_user(request, f'Failed login attempts reset for {count} users.')
     reset_failed_attempts.short_description = "Reset failed attempts"
 
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'recipients', 'status', 'attempts', 'next_attempt_at', 'created_at', 'sent_at')
+    list_filter = ('status', 'created_at')
+    search_fields = ('subject', 'to')
+    ordering = ('-created_at',)
+    list_per_page = 50
+    readonly_fields = ('attempts', 'last_error', 'lease_token', 'leased_until', 'created_at', 'sent_at')
+    # Bodies carry reset links and temporary passwords; never show them to staff
+    exclude = ('body_text', 'body_html')
+    
+    actions = ['requeue_emails']
+    
+    def recipients(self, obj):
+        """Display recipient list"""
+        return ', '.join(obj.to)
+    recipients.short_description = 'To'
+    
+    def requeue_emails(self, request, queryset):
+        """Move dead-lettered emails back to the outbox"""
+        count = requeue_dead_letters(queryset)
+        self.message_user(request, f'{count} dead-lettered emails requeued.')
+    requeue_emails.short_description = "Requeue dead-lettered emails"
+
 # Customize admin site
 admin.site.site_header = "Prodigy Auth Administration"
 admin.site.site_title = "Prodigy Auth Admin"
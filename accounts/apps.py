@@ -0,0 +1,23 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class AccountsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'accounts'
+
+    def ready(self):
+        # Connect signal receivers (cache invalidation, periodic job start-up) and system checks
+        from . import checks, signals  # noqa: F401
+        from .activity import session_activity
+        from .lockout import failed_logins
+        from .outbox import purge_outbox
+        from .purge import purge_expired_tokens
+        from .reaper import reap_sessions
+        from .scheduler import scheduler
+
+        scheduler.register('purge_tokens', purge_expired_tokens, getattr(settings, 'TOKEN_PURGE_INTERVAL', 60 * 60))
+        scheduler.register('reap_sessions', reap_sessions, getattr(settings, 'SESSION_REAPER_INTERVAL', 60 * 60))
+        scheduler.register('purge_outbox', purge_outbox, getattr(settings, 'EMAIL_OUTBOX_PURGE_INTERVAL', 60 * 60))
+        scheduler.register('flush_session_activity', session_activity.flush, session_activity.flush_interval, exclusive=False)
+        scheduler.register('flush_failed_logins', failed_logins.flush, getattr(settings, 'FAILED_LOGIN_FLUSH_INTERVAL', 30), exclusive=False)
@@ -0,0 +1,11 @@
+from django.urls import path
+from . import async_views
+
+# ASGI-native endpoints; only worth routing to when served by an ASGI server
+urlpatterns = [
+    path('auth/login/', async_views.login_view, name='async_login'),
+    path('auth/profile/', async_views.profile, name='async_profile'),
+    path('auth/verify-email/', async_views.verify_email, name='async_verify_email'),
+    path('auth/2fa-status/', async_views.get_2fa_status, name='async_get_2fa_status'),
+    path('token/refresh/', async_views.token_refresh, name='async_token_refresh'),
+]
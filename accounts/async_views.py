@@ -0,0 +1,271 @@
+"""
+Async Views for Prodigy Auth
+ASGI-native versions of the hottest endpoints, served under /api/async/
+"""
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_http_methods, require_POST
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from .audit import is_sync_action, log_login_attempt
+from .email_service import email_service
+from .hashing import HashingBusy
+from .login import AccountLocked, aauthenticate_credentials, acomplete_login
+from .throttling import LoginThrottled, throttle_address
+from .revocation import TOKEN_VERSION_CLAIM, ais_token_revoked
+from .serializers import CustomTokenRefreshSerializer, UserProfileSerializer
+from .tokens import RefreshToken
+from .user_cache import aload_secrets, user_lookup
+import json
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+# Signature and expiry checks only; revocation is checked with the async cache
+jwt_authentication = JWTAuthentication()
+
+
+def error_response(detail, status, code=None):
+    body = {'detail': detail}
+    if code:
+        body['code'] = code
+    return JsonResponse(body, status=status)
+
+
+def parse_json(request):
+    """Request body as a dict, or None when it is not a JSON object"""
+    try:
+        data = json.loads(request.body or b'{}')
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def client_address(request):
+    ip_address = request.META.get('HTTP_X_FORWARDED_FOR', '').split(',')[0] or request.META.get('REMOTE_ADDR', '127.0.0.1')
+    return ip_address, request.META.get('HTTP_USER_AGENT', '')
+
+
+async def alog_login_attempt(**kwargs):
+    """Buffered audit events never touch the database; sync ones need a thread"""
+    if is_sync_action('login' if kwargs.get('success') else 'failed_login'):
+        await sync_to_async(log_login_attempt)(**kwargs)
+    else:
+        log_login_attempt(**kwargs)
+
+
+async def authenticate_request(request):
+    """
+    Resolve the Bearer token on `request` the way TokenVersionJWTAuthentication does
+
+    Returns (user, None) on success, or (None, error_response). Also sets
+    request.user and request.auth so SessionActivityMiddleware sees the token.
+    """
+    header = jwt_authentication.get_header(request)
+    raw_token = jwt_authentication.get_raw_token(header) if header else None
+    if raw_token is None:
+        return None, error_response('Authentication credentials were not provided.', 401, 'not_authenticated')
+
+    try:
+        token = jwt_authentication.get_validated_token(raw_token)
+    except InvalidToken:
+        return None, error_response('Given token not valid for any token type', 401, 'token_not_valid')
+
+    if await ais_token_revoked(token):
+        return None, error_response('Token has been revoked', 401, 'token_not_valid')
+
+    user = await user_lookup.afind_by_id(token[api_settings.USER_ID_CLAIM], token.get(TOKEN_VERSION_CLAIM, 0))
+    if user is None:
+        return None, error_response('User not found', 401, 'user_not_found')
+    if not user.is_active:
+        return None, error_response('User is inactive', 401, 'user_inactive')
+
+    request.user = user
+    request.auth = token
+    return user, None
+
+
+@csrf_exempt
+@require_POST
+async def login_view(request):
+    """Async login_view: same request and response shapes"""
+    data = parse_json(request)
+    if data is None:
+        return error_response('JSON parse error', 400, 'parse_error')
+
+    ip_address, user_agent = client_address(request)
+    email = data.get('email')
+    password = data.get('password')
+
+    errors = {field: ['This field is required.'] for field in ('email', 'password') if not data.get(field)}
+    if errors:
+        return JsonResponse(errors, status=400)
+
+    try:
+        user = await aauthenticate_credentials(email, password, throttle_address(request))
+    except AccountLocked:
+        errors = {'non_field_errors': ['Account temporarily locked due to multiple failed login attempts. Please try again later.']}
+        await alog_login_attempt(
+            user=None,
+            success=False,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            details={'email': email, 'errors': errors}
+        )
+        return JsonResponse(errors, status=400)
+    except (HashingBusy, LoginThrottled) as e:
+        response = error_response(str(e.detail), e.status_code, e.default_code)
+        response['Retry-After'] = str(e.wait)
+        return response
+
+    if user is None:
+        return error_response('No active account found with the given credentials', 401, 'no_active_account')
+
+    refresh, session_key = await acomplete_login(user, ip_address, user_agent)
+
+    await alog_login_attempt(
+        user=user,
+        success=True,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        details={'session_key': session_key}
+    )
+
+    return JsonResponse({
+        'access': str(refresh.access_token),
+        'refresh': str(refresh),
+        'session_key': session_key,
+        'user': {
+            'id': user.id,
+            'email': user.email,
+            'username': user.username,
+            'role': user.role,
+            'is_verified': user.is_verified,
+            'has_2fa': bool(user.otp_secret),
+        }
+    })
+
+
+@csrf_exempt
+@require_POST
+async def token_refresh(request):
+    """
+    Async TokenRefreshView
+
+    Rotation and blacklisting write several rows in one transaction, so the
+    serializer runs in a single thread hop rather than one per query.
+    """
+    data = parse_json(request)
+    if data is None:
+        return error_response('JSON parse error', 400, 'parse_error')
+
+    serializer = CustomTokenRefreshSerializer(data=data)
+    try:
+        is_valid = await sync_to_async(serializer.is_valid)()
+    except TokenError as e:
+        return error_response(str(e), 401, 'token_not_valid')
+    except AuthenticationFailed as e:
+        return error_response(str(e.detail), 401, e.detail.code)
+
+    if not is_valid:
+        return JsonResponse(serializer.errors, status=400)
+    return JsonResponse(serializer.validated_data)
+
+
+@csrf_exempt
+@require_POST
+async def verify_email(request):
+    """Async verify_email with the welcome email enqueued on the async ORM"""
+    data = parse_json(request)
+    if data is None:
+        return error_response('JSON parse error', 400, 'parse_error')
+
+    try:
+        token = uuid.UUID(str(data.get('token')))
+    except ValueError:
+        return JsonResponse({'token': ['Must be a valid UUID.']}, status=400)
+
+    try:
+        user = await User.objects.filter(verification_token=token).afirst()
+        if user is None:
+            return JsonResponse({'token': ['Invalid verification token']}, status=400)
+        if user.is_verified:
+            return JsonResponse({'token': ['Email already verified']}, status=400)
+        if not user.is_verification_token_valid():
+            return JsonResponse({'token': ['Verification token has expired']}, status=400)
+
+        user.is_verified = True
+        await user.asave(update_fields=['is_verified'])
+
+        await email_service.asend_welcome_email(user)
+
+        refresh = await RefreshToken.afor_user(user)
+
+        return JsonResponse({
+            'message': 'Email verified successfully! Welcome to Prodigy Auth!',
+            'user': {
+                'id': user.id,
+                'email': user.email,
+                'username': user.username,
+                'role': user.role,
+                'is_verified': user.is_verified,
+            },
+            'access': str(refresh.access_token),
+            'refresh': str(refresh),
+        })
+    except Exception as e:
+        return JsonResponse({
+            'error': f'Verification failed: {str(e)}'
+        }, status=400)
+
+
+@require_GET
+async def get_2fa_status(request):
+    """Async get_2fa_status"""
+    user, error = await authenticate_request(request)
+    if error:
+        return error
+
+    # Cached users carry no OTP secret; reading the deferred field here would
+    # run a synchronous query on the event loop
+    await aload_secrets(user)
+
+    return JsonResponse({
+        'is_2fa_enabled': bool(user.otp_secret),
+        'has_2fa_secret': bool(user.otp_secret)
+    })
+
+
+@csrf_exempt
+@require_http_methods(['GET', 'PUT', 'PATCH'])
+async def profile(request):
+    """Async UserProfileView: reads stay on the event loop, updates hop once"""
+    user, error = await authenticate_request(request)
+    if error:
+        return error
+
+    if request.method == 'GET':
+        return JsonResponse(UserProfileSerializer(user).data)
+
+    data = parse_json(request)
+    if data is None:
+        return error_response('JSON parse error', 400, 'parse_error')
+
+    serializer = UserProfileSerializer(user, data=data, partial=request.method == 'PATCH')
+
+    def save():
+        if not serializer.is_valid():
+            return False
+        serializer.save()
+        return True
+
+    if not await sync_to_async(save)():
+        return JsonResponse(serializer.errors, status=400)
+    return JsonResponse(serializer.data)
@@ -3,11 +3,142 @@ Audit Logging Utility for Prodigy Auth
 Provides easy-to-use functions for logging security events
 """
 
+from django.conf import settings
+from django.db import close_old_connections
 from .models import AuditLog
+import atexit
 import logging
+import queue
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Actions always written synchronously, even when audit logging is buffered
+DEFAULT_SYNC_ACTIONS = [
+    'account_locked',
+    'account_unlocked',
+    'password_change',
+    'password_reset',
+    '2fa_enable',
+    '2fa_disable',
+    'admin_role_change',
+    'admin_user_activate',
+    'admin_user_deactivate',
+    'admin_user_verify',
+    'admin_reset_attempts',
+    'suspicious_activity',
+]
+
+
+class AuditLogBuffer:
+    """
+    In-process buffer that persists audit events with bulk_create
+    
+    Events are held in a bounded queue and flushed by a background thread when
+    `flush_size` events are waiting, every `flush_interval` seconds, and at
+    interpreter shutdown. Events arriving while the queue is full are dropped
+    and counted rather than blocking the request.
+    """
+    
+    def __init__(self, max_size=None, flush_size=None, flush_interval=None):
+        self.max_size = max_size or getattr(settings, 'AUDIT_LOG_BUFFER_SIZE', 10000)
+        self.flush_size = flush_size or getattr(settings, 'AUDIT_LOG_FLUSH_SIZE', 100)
+        self.flush_interval = flush_interval or getattr(settings, 'AUDIT_LOG_FLUSH_INTERVAL', 2)
+        self._queue = queue.Queue(maxsize=self.max_size)
+        self._wakeup = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self.dropped = 0
+        self.flushed = 0
+        self.flush_errors = 0
+    
+    def put(self, audit_log):
+        """Queue an unsaved AuditLog; returns False if the event was dropped"""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(audit_log)
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(f"Audit buffer full, dropped {audit_log.action} event ({self.dropped} dropped so far)")
+            return False
+        
+        if self._queue.qsize() >= self.flush_size:
+            self._wakeup.set()
+        return True
+    
+    def flush(self):
+        """Write every queued event to the database; returns the number written"""
+        with self._flush_lock:
+            batch = []
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            if not batch:
+                return 0
+            
+            try:
+                AuditLog.objects.bulk_create(batch, batch_size=500)
+                written = len(batch)
+            except Exception as e:
+                # One bad row (e.g. a since-deleted user) must not lose the whole batch
+                logger.error(f"Bulk audit log insert failed, retrying row by row: {e}")
+                written = 0
+                for audit_log in batch:
+                    try:
+                        audit_log.save()
+                        written += 1
+                    except Exception as row_error:
+                        self.flush_errors += 1
+                        logger.error(f"Failed to create audit log: {row_error}")
+            
+            self.flushed += written
+            return written
+    
+    def stats(self):
+        """Buffer metrics for monitoring"""
+        return {
+            'queue_depth': self._queue.qsize(),
+            'max_size': self.max_size,
+            'dropped': self.dropped,
+            'flushed': self.flushed,
+            'flush_errors': self.flush_errors,
+        }
+    
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='audit-log-flusher', daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+    
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Audit buffer flush failed: {e}")
+            finally:
+                close_old_connections()
+
+
+# Global instance
+audit_buffer = AuditLogBuffer()
+
+
+def is_sync_action(action):
+    """Whether an action must be persisted before the request continues"""
+    if getattr(settings, 'AUDIT_LOG_MODE', 'buffered') == 'sync':
+        return True
+    return action in getattr(settings, 'AUDIT_LOG_SYNC_ACTIONS', DEFAULT_SYNC_ACTIONS)
+
 def log_audit_event(action, user=None, ip_address=None, user_agent=None, 
                    details=None, success=True, admin_user=None, request=None):
     """
@@ -22,6 +153,9 @@ def log_audit_event(action, user=None, ip_address=None, user_agent=None,
         success: Whether the action was successful (default: True)
         admin_user: Admin user who performed the action (optional)
         request: Django request object (optional, for auto-extracting IP/UA)
+    
+    Security-critical actions are written immediately; everything else goes
+    through the audit buffer and is returned unsaved.
     """
     
     # Extract IP and user agent from request if provided
@@ -45,7 +179,7 @@ def log_audit_event(action, user=None, ip_address=None, user_agent=None,
         details = {}
     
     try:
-        audit_log = AuditLog.objects.create(
+        audit_log = AuditLog(
             user=user,
             action=action,
             ip_address=ip_address,
@@ -55,7 +189,12 @@ def log_audit_event(action, user=None, ip_address=None, user_agent=None,
             admin_user=admin_user
         )
         
-        logger.info(f"Audit log created: {action} for user {user} from {ip_address}")
+        if is_sync_action(action):
+            audit_log.save()
+            logger.info(f"Audit log created: {action} for user {user} from {ip_address}")
+        else:
+            audit_buffer.put(audit_log)
+            logger.info(f"Audit log queued: {action} for user {user} from {ip_address}")
         return audit_log
         
     except Exception as e:
@@ -0,0 +1,59 @@
+"""
+JWT Authentication for Prodigy Auth
+Access-token validation with token_version revocation and cached user resolution
+"""
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+from .revocation import TOKEN_VERSION_CLAIM, is_token_revoked
+from .user_cache import user_lookup
+
+
+class TokenVersionJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that rejects revoked access tokens
+
+    A token is revoked when its `ver` claim is older than the user's
+    token_version (logout everywhere) or when its JTI was revoked on logout.
+    Both are answered by one cache lookup instead of a blacklist table query.
+
+    The user is resolved through user_lookup.find_by_id instead of a SELECT
+    per request. Cache entries are written on login, dropped whenever the
+    user is saved, deleted or bulk-updated, and ignored when their
+    token_version differs from the token's, so a role change, deactivation
+    or version bump is never served from a stale copy.
+    """
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+
+        if is_token_revoked(validated_token):
+            raise InvalidToken({
+                'detail': 'Token has been revoked',
+                'code': 'token_not_valid',
+            })
+
+        return validated_token
+
+    def get_user(self, validated_token):
+        # Same checks and error codes as JWTAuthentication.get_user
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        user = user_lookup.find_by_id(user_id, validated_token.get(TOKEN_VERSION_CLAIM, 0))
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
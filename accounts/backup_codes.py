@@ -0,0 +1,97 @@
+"""
+2FA Backup Codes for Prodigy Auth
+Keyed-hash storage, bulk issuing and single-statement redemption of recovery codes
+"""
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.crypto import get_random_string, salted_hmac
+from .models import TwoFactorBackupCode
+import string
+
+BACKUP_CODE_COUNT = 10
+BACKUP_CODE_LENGTH = 8
+BACKUP_CODE_ALPHABET = string.ascii_uppercase + string.digits
+
+# Changing the salt or BACKUP_CODE_HASH_KEY invalidates every stored code
+BACKUP_CODE_HASH_SALT = 'accounts.backup_codes'
+
+
+def normalize_backup_code(code):
+    """Codes are shown upper-case and may be typed with spaces or dashes"""
+    return ''.join((code or '').split()).replace('-', '').upper()
+
+
+def hash_backup_code(code):
+    """
+    HMAC-SHA256 of a normalized code
+
+    Codes carry ~41 bits of entropy, too little to resist brute force if the
+    table leaked with a plain hash; the server-side key closes that gap while
+    keeping lookups a single indexed equality match.
+    """
+    secret = getattr(settings, 'BACKUP_CODE_HASH_KEY', None) or settings.SECRET_KEY
+    return salted_hmac(BACKUP_CODE_HASH_SALT, normalize_backup_code(code), secret=secret, algorithm='sha256').hexdigest()
+
+
+def generate_backup_codes(user, count=BACKUP_CODE_COUNT):
+    """
+    Replace the user's backup codes and return the new plaintext codes
+
+    One DELETE and one bulk INSERT in a transaction; only hashes are stored,
+    so the returned codes can never be shown again.
+    """
+    codes = [get_random_string(BACKUP_CODE_LENGTH, BACKUP_CODE_ALPHABET) for _ in range(count)]
+
+    with transaction.atomic():
+        TwoFactorBackupCode.objects.filter(user=user).delete()
+        TwoFactorBackupCode.objects.bulk_create([
+            TwoFactorBackupCode(user=user, code_hash=hash_backup_code(code))
+            for code in codes
+        ])
+
+    return codes
+
+
+def _supports_update_returning():
+    if connection.vendor == 'postgresql':
+        return True
+    return connection.vendor == 'sqlite' and connection.features.can_return_columns_from_insert
+
+
+def redeem_backup_code(user, code):
+    """
+    Mark one of the user's unused codes as used
+
+    Returns the number of unused codes left, or None if the code is wrong or
+    already used. The `used = False` guard makes the UPDATE the arbiter, so
+    two concurrent requests can never both redeem the same code. Where the
+    database supports UPDATE ... RETURNING, the remaining count comes back
+    from the same statement.
+    """
+    code_hash = hash_backup_code(code)
+    now = timezone.now()
+
+    if not _supports_update_returning():
+        redeemed = TwoFactorBackupCode.objects.filter(
+            user=user, code_hash=code_hash, used=False
+        ).update(used=True, used_at=now)
+        if not redeemed:
+            return None
+        return TwoFactorBackupCode.objects.filter(user=user, used=False).count()
+
+    table = connection.ops.quote_name(TwoFactorBackupCode._meta.db_table)
+    # Other unused codes, excluding the updated row, so the count does not
+    # depend on whether the subquery sees the row before or after the UPDATE
+    sql = (
+        f"UPDATE {table} SET used = %s, used_at = %s "
+        f"WHERE user_id = %s AND code_hash = %s AND used = %s "
+        f"RETURNING (SELECT COUNT(*) FROM {table} AS other "
+        f"WHERE other.user_id = {table}.user_id AND other.used = %s AND other.id <> {table}.id)"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [True, connection.ops.adapt_datetimefield_value(now), user.pk, code_hash, False, False])
+        row = cursor.fetchone()
+
+    return row[0] if row else None
@@ -0,0 +1,34 @@
+"""
+System Checks for Prodigy Auth
+Configuration the security features depend on
+"""
+
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+# Backends whose data is private to one process
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    Login throttles, failed-login counters, token versions and revocations
+    are kept in the default cache. With a per-process cache each worker
+    counts and revokes on its own, so lockouts multiply by the worker count
+    and logouts are not seen by other workers. Only the single-process
+    development server (DEBUG) and test runner may run without a shared cache.
+    """
+    backend = settings.CACHES.get('default', {}).get('BACKEND')
+    if settings.DEBUG or getattr(settings, 'TESTING', False) or backend not in PROCESS_LOCAL_CACHE_BACKENDS:
+        return []
+    return [
+        Error(
+            f'The default cache ({backend}) is not shared between processes.',
+            hint='Set REDIS_URL (or configure another shared CACHES backend) before running with DEBUG = False.',
+            id='accounts.E001',
+        )
+    ]
@@ -0,0 +1,75 @@
+"""
+Email Template Registry for Prodigy Auth
+Compiles email templates once and renders them with per-recipient fields at send time
+"""
+
+from django.conf import settings
+from django.template import TemplateDoesNotExist, engines
+import threading
+
+
+class EmailTemplateRegistry:
+    """
+    Cache of compiled email templates keyed by (name, kind, locale)
+
+    Templates live in accounts/templates/emails/ as <name>.html and <name>.txt.
+    A locale-specific override can be placed in emails/<locale>/<name>.<kind>;
+    otherwise the default template is used.
+    """
+
+    KINDS = ('txt', 'html')
+
+    def __init__(self, engine_name='django'):
+        self.engine_name = engine_name
+        self._compiled = {}
+        self._lock = threading.Lock()
+
+    def get_template(self, name, kind, locale=None):
+        """Return the compiled template, loading and caching it on first use"""
+        locale = locale or getattr(settings, 'LANGUAGE_CODE', 'en-us')
+        key = (name, kind, locale)
+
+        template = self._compiled.get(key)
+        if template is None:
+            engine = engines[self.engine_name]
+            try:
+                template = engine.get_template(f'emails/{locale}/{name}.{kind}')
+            except TemplateDoesNotExist:
+                template = engine.get_template(f'emails/{name}.{kind}')
+            with self._lock:
+                self._compiled[key] = template
+        return template
+
+    def render(self, name, context, locale=None):
+        """Render the text and HTML bodies of an email, returned as (text, html)"""
+        text_content = self.get_template(name, 'txt', locale).render(context)
+        html_content = self.get_template(name, 'html', locale).render(context)
+        return text_content, html_content
+
+    def preload(self, names, locale=None):
+        """Compile the given templates up front, e.g. at worker start-up"""
+        for name in names:
+            for kind in self.KINDS:
+                self.get_template(name, kind, locale)
+
+    def clear(self):
+        """Drop every compiled template (e.g. after editing templates)"""
+        with self._lock:
+            self._compiled.clear()
+
+
+# Global instance
+email_templates = EmailTemplateRegistry()
+
+EMAIL_TEMPLATE_NAMES = [
+    'verification',
+    'welcome',
+    'password_reset',
+    'role_change',
+    'account_status',
+    'password_change',
+    '2fa_enabled',
+    '2fa_disabled',
+    'password_reset_confirmation',
+    'temporary_password',
+]
@@ -0,0 +1,113 @@
+"""
+Audit Log Export for Prodigy Auth
+Stream AuditLog rows as CSV or NDJSON in constant memory
+"""
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.validators import validate_ipv46_address
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from .models import AuditLog
+import csv
+import datetime
+import json
+
+EXPORT_FORMATS = ('csv', 'ndjson')
+EXPORT_CHUNK_SIZE = 2000
+
+# Exported columns, in CSV header order (user_email is joined from the user row)
+EXPORT_FIELDS = (
+    'id', 'timestamp', 'action', 'success', 'user_id', 'user__email',
+    'admin_user_id', 'ip_address', 'user_agent', 'details',
+)
+EXPORT_HEADER = [field.replace('__', '_') for field in EXPORT_FIELDS]
+
+
+class InvalidExportFilter(ValueError):
+    """Raised when an export filter value cannot be parsed"""
+    pass
+
+
+def parse_timestamp(value, end_of_day=False):
+    """Accept an ISO datetime or a plain date (start or end of that day)"""
+    try:
+        # Dates first: parse_datetime also accepts a bare date, as midnight.
+        # Well-formed but impossible values (2024-02-30) raise ValueError.
+        day = parse_date(value)
+        moment = parse_datetime(value) if day is None else None
+    except ValueError:
+        day = moment = None
+    if day is not None:
+        moment = datetime.datetime.combine(day, datetime.time.max if end_of_day else datetime.time.min)
+    elif moment is None:
+        raise InvalidExportFilter(f'Invalid date or datetime: {value}')
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def filter_audit_logs(action=None, since=None, until=None, user=None, ip_address=None):
+    """
+    AuditLog queryset for an export, oldest first
+
+    `user` may be a user id or an email address; since/until accept ISO
+    datetimes or dates. Raises InvalidExportFilter on unparseable values.
+    """
+    queryset = AuditLog.objects.all()
+
+    if action:
+        queryset = queryset.filter(action__in=action.split(','))
+    if since:
+        queryset = queryset.filter(timestamp__gte=parse_timestamp(since))
+    if until:
+        queryset = queryset.filter(timestamp__lte=parse_timestamp(until, end_of_day=True))
+    if user:
+        user = str(user)
+        queryset = queryset.filter(user_id=int(user)) if user.isdigit() else queryset.filter(user__email=user)
+    if ip_address:
+        try:
+            validate_ipv46_address(ip_address)
+        except ValidationError:
+            raise InvalidExportFilter(f'Invalid IP address: {ip_address}')
+        queryset = queryset.filter(ip_address=ip_address)
+
+    return queryset.order_by('timestamp', 'id')
+
+
+def iter_rows(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Plain value tuples fetched from the database chunk_size rows at a time"""
+    return queryset.values_list(*EXPORT_FIELDS).iterator(chunk_size=chunk_size)
+
+
+class Echo:
+    """File-like object whose write() returns the value instead of storing it"""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_HEADER)
+    for row in rows:
+        row = list(row)
+        row[1] = row[1].isoformat()  # Full precision, same as NDJSON
+        row[-1] = json.dumps(row[-1], cls=DjangoJSONEncoder)
+        yield writer.writerow(row)
+
+
+def iter_ndjson(rows):
+    encoder = DjangoJSONEncoder()
+    for row in rows:
+        record = dict(zip(EXPORT_HEADER, row))
+        record['timestamp'] = record['timestamp'].isoformat()
+        yield encoder.encode(record) + '\n'
+
+
+def stream_audit_logs(queryset, export_format='csv', chunk_size=EXPORT_CHUNK_SIZE):
+    """Generator of CSV lines or NDJSON records for `queryset`"""
+    rows = iter_rows(queryset, chunk_size)
+    if export_format == 'ndjson':
+        return iter_ndjson(rows)
+    return iter_csv(rows)
@@ -0,0 +1,129 @@
+"""
+Password Hashing Service for Prodigy Auth
+Bounded executor with admission control for CPU-heavy password hashing
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.contrib.auth import hashers
+from rest_framework import status
+from rest_framework.exceptions import APIException
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class HashingBusy(APIException):
+    """Every hashing slot and queue position is taken; the client should retry"""
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Server is busy, please try again shortly.'
+    default_code = 'hashing_busy'
+
+    def __init__(self, wait):
+        super().__init__()
+        # DRF's exception handler turns `wait` into a Retry-After header
+        self.wait = wait
+
+
+class PasswordHashingService:
+    """
+    Runs password hashing on a fixed pool of worker threads
+
+    At most HASHING_MAX_WORKERS hashes run at once per process, whatever the
+    number of request threads; up to HASHING_MAX_QUEUE more may wait. Beyond
+    that, callers get HashingBusy (503 + Retry-After) immediately instead of
+    piling up behind the CPU. PBKDF2 releases the GIL, so the workers hash in
+    parallel while the request threads only wait on the result.
+    """
+
+    def __init__(self, max_workers=None, max_queue=None, retry_after=None):
+        self.max_workers = max_workers or getattr(settings, 'HASHING_MAX_WORKERS', 4)
+        self.max_queue = max_queue if max_queue is not None else getattr(settings, 'HASHING_MAX_QUEUE', 32)
+        self.retry_after = retry_after or getattr(settings, 'HASHING_RETRY_AFTER', 2)
+        self._admission = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='password-hashing')
+        self._stats_lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def run(self, func, *args):
+        """Run func(*args) on the pool and return its result, or raise HashingBusy"""
+        self._admit()
+        try:
+            return self._executor.submit(func, *args).result()
+        finally:
+            self._release()
+
+    async def arun(self, func, *args):
+        """run() for async callers: awaits the pool without blocking the event loop"""
+        self._admit()
+        try:
+            return await asyncio.wrap_future(self._executor.submit(func, *args))
+        finally:
+            self._release()
+
+    def _admit(self):
+        if not self._admission.acquire(blocking=False):
+            with self._stats_lock:
+                self.rejected += 1
+            logger.warning(f"Password hashing saturated, rejecting request ({self.rejected} rejected so far)")
+            raise HashingBusy(self.retry_after)
+
+        with self._stats_lock:
+            self.in_flight += 1
+
+    def _release(self):
+        with self._stats_lock:
+            self.in_flight -= 1
+            self.completed += 1
+        self._admission.release()
+
+    def make_password(self, raw_password):
+        return self.run(hashers.make_password, raw_password)
+
+    async def amake_password(self, raw_password):
+        return await self.arun(hashers.make_password, raw_password)
+
+    def set_password(self, user, raw_password):
+        """Like user.set_password(), with the hashing done on the pool"""
+        user.password = self.make_password(raw_password)
+        # Lets AbstractBaseUser.save() notify the password validators
+        user._password = raw_password
+
+    def check_password(self, user, raw_password):
+        """
+        Like user.check_password(), with the hashing done on the pool
+
+        Hashes stored with outdated parameters are upgraded the same way Django
+        does it, but the re-hash also runs on the pool.
+        """
+        is_correct, must_update = self.run(hashers.verify_password, raw_password, user.password)
+        if is_correct and must_update:
+            self.set_password(user, raw_password)
+            user._password = None
+            user.save(update_fields=['password'])
+        return is_correct
+
+    async def acheck_password(self, user, raw_password):
+        """Async check_password()"""
+        is_correct, must_update = await self.arun(hashers.verify_password, raw_password, user.password)
+        if is_correct and must_update:
+            user.password = await self.amake_password(raw_password)
+            await user.asave(update_fields=['password'])
+        return is_correct
+
+    def stats(self):
+        return {
+            'max_workers': self.max_workers,
+            'max_queue': self.max_queue,
+            'in_flight': self.in_flight,
+            'completed': self.completed,
+            'rejected': self.rejected,
+        }
+
+
+# Global instance
+password_hashing = PasswordHashingService()
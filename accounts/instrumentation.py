@@ -0,0 +1,52 @@
+"""
+Query Instrumentation for Prodigy Auth
+Per-request query budgets that flag hot-path regressions
+"""
+
+from contextlib import contextmanager
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Transaction control is not a round trip we can batch away, so it is not counted
+TRANSACTION_STATEMENTS = ('BEGIN', 'COMMIT', 'ROLLBACK', 'SAVEPOINT', 'RELEASE SAVEPOINT')
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised in strict mode when a block runs more queries than its budget"""
+    pass
+
+
+@contextmanager
+def query_budget(limit, label, strict=None):
+    """
+    Count the queries run inside the block and compare them to `limit`
+
+    Only active when DEBUG or strict mode is on. In strict mode
+    (QUERY_BUDGET_STRICT = True, e.g. in tests) exceeding the budget raises
+    QueryBudgetExceeded; otherwise a warning listing the queries is logged.
+    """
+    if strict is None:
+        strict = getattr(settings, 'QUERY_BUDGET_STRICT', False)
+
+    if not (settings.DEBUG or strict):
+        yield None
+        return
+
+    with CaptureQueriesContext(connection) as context:
+        yield context
+
+    statements = [
+        query['sql'] for query in context.captured_queries
+        if not query['sql'].upper().startswith(TRANSACTION_STATEMENTS)
+    ]
+    executed = len(statements)
+    if executed > limit:
+        queries = '\n'.join(statements)
+        message = f"{label} ran {executed} queries (budget {limit}):\n{queries}"
+        if strict:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
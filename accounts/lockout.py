@@ -0,0 +1,119 @@
+"""
+Failed Login Tracking for Prodigy Auth
+Atomic cache counters for failed logins, written to CustomUser lazily
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from .user_cache import user_lookup
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+LOCKOUT_THRESHOLD = 5
+
+
+class FailedLoginTracker:
+    """
+    Counts failed logins in the cache instead of UPDATEing the user each time
+
+    record_failure() is one atomic cache incr (seeded from the user row the
+    first time), so concurrent failures can never both slip under the
+    threshold. The lock decision is made from that counter; only the lock
+    transition itself writes the row immediately, because
+    account_locked_until must be visible to every process. Other counts are
+    written to failed_login_attempts by flush() - run every
+    FAILED_LOGIN_FLUSH_INTERVAL seconds by the periodic job thread - with
+    one UPDATE per distinct count. A successful login or an admin reset
+    clears the counter.
+
+    The counters are only a lockout if every worker shares them: with a
+    per-process cache each worker would allow its own five attempts, and a
+    restart would forget them all. Production must run a shared cache
+    (REDIS_URL; enforced by the accounts.E001 system check).
+    """
+
+    def __init__(self, threshold=LOCKOUT_THRESHOLD, counter_ttl=None):
+        self.threshold = threshold
+        self.counter_ttl = counter_ttl or getattr(settings, 'FAILED_LOGIN_COUNTER_TTL', 24 * 60 * 60)
+        self._pending = set()
+        self._lock = threading.Lock()
+        self.flushed = 0
+
+    def cache_key(self, user_id):
+        return f'failed_logins:{user_id}'
+
+    def record_failure(self, user):
+        """Count a failed attempt for a loaded user; returns True if it locked the account"""
+        key = self.cache_key(user.pk)
+        try:
+            count = cache.incr(key)
+        except ValueError:
+            # No counter yet (or evicted): continue from the last written value
+            count = user.failed_login_attempts + 1
+            if not cache.add(key, count, self.counter_ttl):
+                count = cache.incr(key)
+
+        user.failed_login_attempts = count
+        if count >= self.threshold and not user.is_account_locked():
+            with self._lock:
+                self._pending.discard(user.pk)
+            # Saves the count too; goes through save() so signals still fire
+            user.lock_account()
+            logger.warning(f"Account {user.email} locked after {count} failed login attempts")
+            return True
+
+        with self._lock:
+            self._pending.add(user.pk)
+        return False
+
+    def clear(self, user):
+        """Forget the counter after a successful login; True if one was cached"""
+        with self._lock:
+            self._pending.discard(user.pk)
+        return bool(cache.delete(self.cache_key(user.pk)))
+
+    def reset(self, user_ids):
+        """Drop counters for users whose columns an admin just reset"""
+        user_ids = list(user_ids)
+        with self._lock:
+            self._pending.difference_update(user_ids)
+        cache.delete_many([self.cache_key(user_id) for user_id in user_ids])
+
+    def current_counts(self, user_ids):
+        """Cached counts (newer than the table) for the given users"""
+        keys = {self.cache_key(user_id): user_id for user_id in user_ids}
+        return {keys[key]: count for key, count in cache.get_many(keys).items()}
+
+    def flush(self):
+        """Write pending counts to CustomUser; returns the number of users updated"""
+        with self._lock:
+            pending, self._pending = self._pending, set()
+
+        if not pending:
+            return 0
+
+        # Counters cleared by a successful login (or evicted) are skipped,
+        # leaving the row as complete_login or the last flush wrote it
+        by_count = {}
+        for user_id, count in self.current_counts(pending).items():
+            by_count.setdefault(count, []).append(user_id)
+
+        User = get_user_model()
+        updated = 0
+        for count, user_ids in by_count.items():
+            updated += User.objects.filter(pk__in=user_ids).update(failed_login_attempts=count)
+
+        # update() skips post_save; drop cached copies carrying the old columns
+        if updated:
+            flushed_ids = [user_id for user_ids in by_count.values() for user_id in user_ids]
+            user_lookup.invalidate_many(User.objects.filter(pk__in=flushed_ids).only('id', 'email', 'username'))
+
+        self.flushed += updated
+        return updated
+
+
+# Global instance
+failed_logins = FailedLoginTracker()
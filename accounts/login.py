@@ -0,0 +1,134 @@
+"""
+Login Pipeline for Prodigy Auth
+Credential checking and post-login bookkeeping with the minimum number of writes
+"""
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+from .hashing import password_hashing
+from .lockout import failed_logins
+from .models import UserSession
+from .throttling import login_throttle
+from .tokens import RefreshToken
+from .user_cache import aload_secrets, load_secrets, user_lookup
+import uuid
+
+User = get_user_model()
+
+
+class AccountLocked(Exception):
+    """Raised when a login targets a temporarily locked account"""
+    pass
+
+
+def authenticate_credentials(email, password, ip_address=None):
+    """
+    Check an email/password pair with a single user lookup
+
+    Returns the user on success and None on bad credentials or an inactive
+    account. Throttled attempts raise LoginThrottled before the lookup, and
+    locked accounts raise AccountLocked before the password is hashed.
+    Hashing runs on the bounded hashing pool and may raise HashingBusy.
+    """
+    login_throttle.check(email, ip_address)
+
+    user = user_lookup.find('email', email)
+
+    if user is None:
+        # Run the hasher anyway so unknown emails take as long as wrong passwords
+        password_hashing.make_password(password)
+        return None
+
+    if user.is_account_locked():
+        raise AccountLocked()
+
+    # Cached users carry no password hash or OTP secret; one query loads both
+    load_secrets(user)
+
+    if password_hashing.check_password(user, password) and user.is_active:
+        return user
+
+    record_failed_login(user)
+    return None
+
+
+async def aauthenticate_credentials(email, password, ip_address=None):
+    """
+    Async authenticate_credentials() for ASGI views
+
+    The lookup uses the async ORM and the hash is awaited on the hashing pool;
+    the throttle check and recording a failure (which may lock the account)
+    hop to a thread.
+    """
+    await sync_to_async(login_throttle.check)(email, ip_address)
+
+    user = await user_lookup.afind('email', email)
+
+    if user is None:
+        await password_hashing.amake_password(password)
+        return None
+
+    if user.is_account_locked():
+        raise AccountLocked()
+
+    await aload_secrets(user)
+
+    if await password_hashing.acheck_password(user, password) and user.is_active:
+        return user
+
+    await sync_to_async(record_failed_login)(user)
+    return None
+
+
+def record_failed_login(user):
+    """
+    Count a failed attempt on an already-loaded user, locking at the threshold
+
+    The count lives in the cache; the user row is only written when this
+    attempt locks the account (see FailedLoginTracker).
+    """
+    failed_logins.record_failure(user)
+
+
+def complete_login(user, ip_address, user_agent):
+    """
+    Record a successful login and issue tokens
+
+    Runs one UPDATE on the user (clearing lockout fields only when they are
+    set, here or in the failed-login cache) plus the session and
+    outstanding-token INSERTs, all in one transaction.
+    Returns (refresh_token, session_key).
+    """
+    now = timezone.now()
+    updates = {'last_login': now, 'last_login_ip': ip_address}
+    had_cached_failures = failed_logins.clear(user)
+    if had_cached_failures or user.failed_login_attempts or user.account_locked_until:
+        updates.update(failed_login_attempts=0, account_locked_until=None)
+
+    session_key = str(uuid.uuid4())
+
+    with transaction.atomic():
+        User.objects.filter(pk=user.pk).update(**updates)
+        for field, value in updates.items():
+            setattr(user, field, value)
+
+        refresh = RefreshToken.for_user(user, session_key=session_key)
+        UserSession.objects.create(
+            user=user,
+            session_key=session_key,
+            ip_address=ip_address,
+            user_agent=user_agent
+        )
+
+    # update() skips post_save, so drop the cached copy by hand. This user was
+    # read before the password check; caching it could overwrite a concurrent
+    # deactivation or role change, so the next lookup reloads the row instead
+    user_lookup.invalidate(user)
+
+    return refresh, session_key
+
+
+# The three writes share a transaction, which the async ORM cannot open
+acomplete_login = sync_to_async(complete_login)
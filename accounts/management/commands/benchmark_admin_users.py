@@ -0,0 +1,115 @@
+"""
+Django management command to benchmark admin users list pagination
+Usage: python manage.py benchmark_admin_users [--users 1000000] [--skip-full-list]
+
+Seeds synthetic users inside a transaction that is rolled back at the end, then
+times keyset pages against OFFSET pages and the previous load-everything list.
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from accounts.pagination import encode_cursor, filter_users, keyset_page
+from accounts.views import ADMIN_USER_LIST_FIELDS
+import statistics
+import time
+
+User = get_user_model()
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Benchmark keyset vs OFFSET pagination of the admin users list'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000000, help='Synthetic users to seed')
+        parser.add_argument('--page-size', type=int, default=50, help='Users per page')
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per measurement (median reported)')
+        parser.add_argument('--skip-full-list', action='store_true', help='Skip timing the previous unpaginated list')
+
+    def handle(self, *args, **options):
+        self.page_size = options['page_size']
+        self.repeat = options['repeat']
+
+        self.stdout.write(self.style.SUCCESS('🚀 Admin Users List Benchmark'))
+        self.stdout.write('=' * 50)
+
+        try:
+            with transaction.atomic():
+                self.seed(options['users'])
+                self.run(options['skip_full_list'])
+                raise Rollback()
+        except Rollback:
+            self.stdout.write('🧹 Synthetic users rolled back')
+
+        self.stdout.write(self.style.SUCCESS('✅ Benchmark completed!'))
+
+    def seed(self, count):
+        start = time.perf_counter()
+        password = make_password('benchmark-password')
+        base = timezone.now() - timezone.timedelta(days=730)
+        step = timezone.timedelta(days=730) / max(count, 1)
+        batch = []
+
+        for index in range(count):
+            batch.append(User(
+                email=f'bench{index}@example.com',
+                username=f'bench{index}',
+                password=password,
+                role='admin' if index % 100 == 0 else 'user',
+                is_verified=index % 3 != 0,
+                is_active=index % 50 != 0,
+                date_joined=base + step * index,
+            ))
+            if len(batch) == 5000:
+                User.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            User.objects.bulk_create(batch)
+
+        total = User.objects.count()
+        self.stdout.write(f"🌱 Seeded {count:,} users in {time.perf_counter() - start:.1f}s ({total:,} total)")
+        self.stdout.write('')
+
+    def measure(self, func):
+        timings = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    def run(self, skip_full_list):
+        base = User.objects.only(*ADMIN_USER_LIST_FIELDS)
+        total = base.count()
+
+        self.stdout.write(f"📄 Page size {self.page_size} (median of {self.repeat} runs)")
+        self.stdout.write(f"   {'Depth':>10}  {'OFFSET':>10}  {'Keyset':>10}")
+
+        for depth in (0, total // 100, total // 2, max(total - self.page_size, 0)):
+            ordered = base.order_by('-date_joined', '-id')
+            offset_ms = self.measure(lambda: list(ordered[depth:depth + self.page_size]))
+
+            cursor = None
+            if depth:
+                anchor = ordered.values_list('date_joined', 'id')[depth - 1]
+                cursor = encode_cursor(*anchor)
+            keyset_ms = self.measure(lambda: keyset_page(base, cursor=cursor, page_size=self.page_size))
+
+            self.stdout.write(f"   {depth:>10,}  {offset_ms:>8.1f}ms  {keyset_ms:>8.1f}ms")
+
+        filtered = filter_users(base, {'role': 'user', 'verified': 'true', 'active': 'true'})
+        filtered_ms = self.measure(lambda: keyset_page(filtered, page_size=self.page_size))
+        self.stdout.write(f"   Filtered first page (role/verified/active): {filtered_ms:.1f}ms")
+
+        if not skip_full_list:
+            self.stdout.write('')
+            start = time.perf_counter()
+            rows = [(user.id, user.email, user.is_account_locked()) for user in User.objects.all().order_by('-date_joined')]
+            self.stdout.write(f"🐢 Previous full list: {len(rows):,} users in {(time.perf_counter() - start) * 1000:,.0f}ms")
+        self.stdout.write('')
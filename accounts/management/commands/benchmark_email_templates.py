@@ -0,0 +1,61 @@
+"""
+Django management command to benchmark email template rendering
+Usage: python manage.py benchmark_email_templates [--iterations N]
+"""
+
+from django.core.management.base import BaseCommand
+from accounts.email_service import ProdigyEmailService
+from accounts.email_templates import email_templates, EMAIL_TEMPLATE_NAMES
+from accounts.models import CustomUser
+import time
+
+
+class Command(BaseCommand):
+    help = 'Measure renders/sec for each compiled email template'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=2000,
+            help='Renders per template'
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        service = ProdigyEmailService(use_outbox=False)
+
+        user = CustomUser(username='benchmark', email='benchmark@example.com')
+        admin_user = CustomUser(username='admin', email='admin@example.com', role='admin')
+
+        contexts = {
+            'verification': {'verification_url': f'{service.base_url}/verify-email/token/'},
+            'welcome': {},
+            'password_reset': {'reset_url': f'{service.base_url}/reset-password/token/'},
+            'role_change': {'old_role': 'user', 'new_role': 'admin', 'admin_user': admin_user},
+            'account_status': {'is_active': True, 'action': 'Activated', 'admin_user': admin_user},
+            'password_change': {'changed_at': 'January 01, 2026 at 09:00 AM'},
+            '2fa_enabled': {},
+            '2fa_disabled': {},
+            'password_reset_confirmation': {},
+            'temporary_password': {'temp_password': 'Abcdef123456'},
+        }
+
+        self.stdout.write(self.style.SUCCESS('🚀 Email Template Render Benchmark'))
+        self.stdout.write('=' * 50)
+        self.stdout.write(f"📧 Iterations per template: {iterations}")
+        self.stdout.write('')
+
+        # Compile everything first so only per-send rendering is measured
+        email_templates.preload(EMAIL_TEMPLATE_NAMES)
+
+        for name in EMAIL_TEMPLATE_NAMES:
+            context = contexts[name]
+            start = time.perf_counter()
+            for _ in range(iterations):
+                service._render(name, user, **context)
+            elapsed = time.perf_counter() - start
+            self.stdout.write(f"📨 {name:<30} {iterations / elapsed:>10,.0f} renders/sec")
+
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS('✅ Benchmark completed!'))
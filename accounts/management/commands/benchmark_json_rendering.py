@@ -0,0 +1,94 @@
+"""
+Django management command to benchmark JSON rendering and parsing
+Usage: python manage.py benchmark_json_rendering [--users 10000 100000] [--repeat 5]
+
+Builds admin users list payloads of the given sizes in memory (no database
+writes) and compares DRF's stdlib JSONRenderer/JSONParser with the orjson
+FastJSONRenderer/FastJSONParser in time and bytes, checking both render the
+same output.
+"""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from accounts.parsers import FastJSONParser
+from accounts.renderers import FastJSONRenderer, orjson
+import io
+import statistics
+import time
+
+
+def admin_users_payload(count):
+    """Same shape as an admin_users_list response holding `count` users"""
+    now = timezone.now()
+    users = []
+    for index in range(count):
+        users.append({
+            'id': index + 1,
+            'email': f'bench{index}@example.com',
+            'username': f'bench{index}',
+            'role': 'admin' if index % 100 == 0 else 'user',
+            'is_verified': index % 3 != 0,
+            'is_active': index % 50 != 0,
+            'date_joined': now - timezone.timedelta(minutes=index, microseconds=index),
+            'last_login': now - timezone.timedelta(seconds=index) if index % 4 else None,
+            'failed_login_attempts': index % 5,
+            'is_locked': index % 200 == 0,
+            'account_locked_until': now + timezone.timedelta(minutes=15) if index % 200 == 0 else None,
+        })
+    return {'users': users, 'next_cursor': None, 'has_more': False}
+
+
+class Command(BaseCommand):
+    help = 'Benchmark stdlib vs orjson rendering and parsing of the admin users list'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, nargs='+', default=[10000, 100000], help='Payload sizes in users')
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per measurement (median reported)')
+
+    def handle(self, *args, **options):
+        self.repeat = options['repeat']
+
+        self.stdout.write(self.style.SUCCESS('🚀 JSON Rendering Benchmark'))
+        self.stdout.write('=' * 50)
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('⚠️  orjson is not installed; FastJSONRenderer uses the stdlib encoder'))
+        else:
+            self.stdout.write(f"orjson {orjson.__version__} (median of {self.repeat} runs)")
+        self.stdout.write('')
+
+        for count in options['users']:
+            self.run(count)
+
+        self.stdout.write(self.style.SUCCESS('✅ Benchmark completed!'))
+
+    def measure(self, func):
+        timings = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    def run(self, count):
+        data = admin_users_payload(count)
+        stdlib_body = JSONRenderer().render(data)
+        fast_body = FastJSONRenderer().render(data)
+
+        stdlib_render = self.measure(lambda: JSONRenderer().render(data))
+        fast_render = self.measure(lambda: FastJSONRenderer().render(data))
+        stdlib_parse = self.measure(lambda: JSONParser().parse(io.BytesIO(stdlib_body), parser_context={}))
+        fast_parse = self.measure(lambda: FastJSONParser().parse(io.BytesIO(fast_body), parser_context={}))
+
+        self.stdout.write(f"👥 {count:,} users")
+        self.stdout.write(f"   {'':8}  {'stdlib':>10}  {'orjson':>10}  {'speedup':>8}")
+        self.stdout.write(f"   {'Render':8}  {stdlib_render:>8.1f}ms  {fast_render:>8.1f}ms  {stdlib_render / fast_render:>7.1f}x")
+        self.stdout.write(f"   {'Parse':8}  {stdlib_parse:>8.1f}ms  {fast_parse:>8.1f}ms  {stdlib_parse / fast_parse:>7.1f}x")
+        self.stdout.write(f"   {'Bytes':8}  {len(stdlib_body):>10,}  {len(fast_body):>10,}")
+
+        if fast_body == stdlib_body:
+            self.stdout.write('   Output identical to JSONRenderer')
+        else:
+            self.stdout.write(self.style.ERROR('   ❌ Output differs from JSONRenderer'))
+        self.stdout.write('')
@@ -0,0 +1,82 @@
+"""
+Django management command to benchmark 2FA QR code rendering
+Usage: python manage.py benchmark_qr_codes [--renders 200]
+
+Compares the original qrcode/PIL render (box_size=10, border=5) with the
+1-bit PNG and SVG renderers in renders/sec and response bytes, then times
+cached setup calls for the same pending secret.
+"""
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from accounts.qr import QR_FORMATS, qr_codes
+import base64
+import io
+import pyotp
+import qrcode
+import time
+
+
+def legacy_data_uri(data):
+    """setup_2fa's original rendering, kept as the baseline"""
+    qr = qrcode.QRCode(version=1, box_size=10, border=5)
+    qr.add_data(data)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white")
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    return f"data:image/png;base64,{base64.b64encode(buffer.getvalue()).decode()}"
+
+
+class Command(BaseCommand):
+    help = 'Benchmark QR code renders/sec and payload size for 2FA setup'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--renders', type=int, default=200, help='Renders timed per renderer')
+
+    def handle(self, *args, **options):
+        renders = options['renders']
+        uris = [
+            pyotp.TOTP(pyotp.random_base32()).provisioning_uri(name=f'benchmark-user-{i}@example.com', issuer_name='Prodigy Auth')
+            for i in range(renders)
+        ]
+
+        self.stdout.write(self.style.SUCCESS('🔳 QR Code Benchmark'))
+        self.stdout.write('=' * 50)
+        self.stdout.write(f"🎯 {renders:,} provisioning URIs per renderer (fresh secrets, no cache)")
+        self.stdout.write(f"   {'Renderer':<22} {'Renders/sec':>11}  {'Image':>8}  {'Data URI':>9}")
+
+        runs = [('qrcode PIL (original)', legacy_data_uri)]
+        for image_format in QR_FORMATS:
+            runs.append((f'{image_format} renderer', lambda data, image_format=image_format: self.uncached(data, image_format)))
+
+        for label, render in runs:
+            start = time.perf_counter()
+            sizes = [len(render(data)) for data in uris]
+            elapsed = time.perf_counter() - start
+
+            data_uri = sum(sizes) / len(sizes)
+            image = data_uri * 3 / 4  # Undo the base64 expansion of the payload
+            self.stdout.write(f"   {label:<22} {renders / elapsed:>11,.0f}  {image:>7,.0f}B  {data_uri:>8,.0f}B")
+
+        self.stdout.write('')
+        self.stdout.write('♻️  Repeated setup calls for one pending secret')
+        for image_format in QR_FORMATS:
+            cache.delete(qr_codes.cache_key(uris[0], image_format))
+            start = time.perf_counter()
+            qr_codes.data_uri(uris[0], image_format)
+            miss = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(renders):
+                qr_codes.data_uri(uris[0], image_format)
+            hit = (time.perf_counter() - start) / renders
+            cache.delete(qr_codes.cache_key(uris[0], image_format))
+
+            self.stdout.write(f"   {image_format}: miss {miss * 1000:.1f}ms, hit {hit * 1e6:.0f}µs")
+
+        self.stdout.write(self.style.SUCCESS('✅ Benchmark completed!'))
+
+    def uncached(self, data, image_format):
+        image = qr_codes.render(data, image_format)
+        return f"data:{QR_FORMATS[image_format]};base64,{base64.b64encode(image).decode()}"
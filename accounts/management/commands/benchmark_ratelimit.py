@@ -0,0 +1,81 @@
+"""
+Django management command to benchmark the rate limiter
+Usage: python manage.py benchmark_ratelimit [--ips 1000 100000] [--hits N]
+
+Compares the previous timestamp-list limiter with the sliding-window counter
+limiter on an isolated local-memory cache.
+"""
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand
+from accounts.ratelimit import SlidingWindowRateLimiter
+import random
+import time
+
+
+def list_limiter_hit(cache, key, limit, window, now):
+    """The previous middleware algorithm: a pickled list of every timestamp per key"""
+    current_requests = cache.get(key, [])
+    window_start = now - window
+    current_requests = [req_time for req_time in current_requests if req_time > window_start]
+    if len(current_requests) >= limit:
+        return False
+    current_requests.append(now)
+    cache.set(key, current_requests, window)
+    return True
+
+
+class Command(BaseCommand):
+    help = 'Benchmark timestamp-list vs sliding-window counter rate limiting'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ips', type=int, nargs='+', default=[1000, 100000], help='Distinct client IPs per run')
+        parser.add_argument('--hits', type=int, default=200000, help='Requests simulated per run')
+        parser.add_argument('--limit', type=int, default=100, help='Requests allowed per window')
+        parser.add_argument('--window', type=int, default=3600, help='Window length in seconds')
+
+    def handle(self, *args, **options):
+        limit = options['limit']
+        window = options['window']
+        hits = options['hits']
+
+        self.stdout.write(self.style.SUCCESS('🚀 Rate Limiter Benchmark'))
+        self.stdout.write('=' * 50)
+        self.stdout.write(f"📊 Limit: {limit} requests / {window}s, {hits:,} requests per run")
+        self.stdout.write('')
+
+        for ip_count in options['ips']:
+            ips = [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(ip_count)]
+            rng = random.Random(42)
+            traffic = [rng.choice(ips) for _ in range(hits)]
+
+            list_cache = self.make_cache('list', ip_count)
+            start = time.perf_counter()
+            now = time.time()
+            for index, ip in enumerate(traffic):
+                list_limiter_hit(list_cache, f"rate_limit:{ip}:/api/auth/login/", limit, window, now + index * 0.001)
+            list_rate = hits / (time.perf_counter() - start)
+            list_bytes = self.cache_bytes(list_cache)
+
+            counter_cache = self.make_cache('counter', ip_count)
+            limiter = SlidingWindowRateLimiter(cache=counter_cache)
+            start = time.perf_counter()
+            for index, ip in enumerate(traffic):
+                limiter.hit(f"{ip}:/api/auth/login/", limit, window, now=now + index * 0.001)
+            counter_rate = hits / (time.perf_counter() - start)
+            counter_bytes = self.cache_bytes(counter_cache)
+
+            self.stdout.write(f"🌐 {ip_count:,} distinct IPs")
+            self.stdout.write(f"   Timestamp list:  {list_rate:>12,.0f} checks/sec, {list_bytes / ip_count:>8,.0f} bytes/IP")
+            self.stdout.write(f"   Sliding window:  {counter_rate:>12,.0f} checks/sec, {counter_bytes / ip_count:>8,.0f} bytes/IP")
+            self.stdout.write('')
+
+        self.stdout.write(self.style.SUCCESS('✅ Benchmark completed!'))
+
+    def make_cache(self, name, ip_count):
+        """A private cache large enough that nothing is culled during the run"""
+        return LocMemCache(f'benchmark-{name}', {'OPTIONS': {'MAX_ENTRIES': ip_count * 4}})
+
+    def cache_bytes(self, cache):
+        """Approximate memory held by the cache: total size of pickled values"""
+        return sum(len(value) for value in cache._cache.values()) or 1
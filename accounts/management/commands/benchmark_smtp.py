@@ -0,0 +1,102 @@
+"""
+Django management command to benchmark pooled vs per-message SMTP connections
+Usage: python manage.py benchmark_smtp [--messages N] [--host HOST --port PORT]
+
+Without --host, a local aiosmtpd stand-in server is started (pip install aiosmtpd).
+"""
+
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.management.base import BaseCommand, CommandError
+from accounts.smtp_pool import SMTPConnectionPool
+import time
+
+SMTP_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+
+
+class Command(BaseCommand):
+    help = 'Benchmark SMTP throughput with a fresh connection per email vs the connection pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--messages', type=int, default=500, help='Emails to send per run')
+        parser.add_argument('--host', type=str, default=None, help='SMTP server to use instead of a local stand-in')
+        parser.add_argument('--port', type=int, default=8025, help='SMTP server port')
+        parser.add_argument('--pool-size', type=int, default=1, help='Connection pool size')
+
+    def handle(self, *args, **options):
+        controller = None
+        host = options['host']
+        port = options['port']
+
+        if not host:
+            controller = self.start_stand_in(port)
+            host = controller.hostname
+
+        connection_kwargs = {
+            'host': host,
+            'port': port,
+            'username': '',
+            'password': '',
+            'use_tls': False,
+            'use_ssl': False,
+        }
+
+        self.stdout.write(self.style.SUCCESS('🚀 SMTP Connection Benchmark'))
+        self.stdout.write('=' * 50)
+        self.stdout.write(f"📧 Server: {host}:{port}")
+        self.stdout.write(f"📧 Messages per run: {options['messages']}")
+        self.stdout.write('')
+
+        try:
+            before = self.run_per_message(options['messages'], connection_kwargs)
+            self.stdout.write(f"📨 Connection per email: {before:,.1f} messages/sec")
+
+            pool = SMTPConnectionPool(size=options['pool_size'], backend=SMTP_BACKEND, **connection_kwargs)
+            after = self.run_pooled(options['messages'], pool)
+            pool.close_idle()
+            self.stdout.write(f"📨 Pooled connections:  {after:,.1f} messages/sec")
+
+            self.stdout.write('')
+            self.stdout.write(self.style.SUCCESS(f'✅ Speedup: {after / before:.1f}x'))
+        finally:
+            if controller:
+                controller.stop()
+
+    def start_stand_in(self, port):
+        """Start a local SMTP server that accepts and discards every message"""
+        try:
+            from aiosmtpd.controller import Controller
+        except ImportError:
+            raise CommandError('aiosmtpd is not installed; install it or pass --host/--port of an SMTP stand-in')
+
+        class DiscardHandler:
+            async def handle_DATA(self, server, session, envelope):
+                return '250 Message accepted for delivery'
+
+        controller = Controller(DiscardHandler(), hostname='127.0.0.1', port=port)
+        controller.start()
+        return controller
+
+    def build_message(self, index):
+        msg = EmailMultiAlternatives(
+            subject=f'Benchmark message {index}',
+            body='Prodigy Auth SMTP benchmark',
+            from_email='benchmark@prodigyauth.com',
+            to=[f'user{index}@example.com']
+        )
+        msg.attach_alternative('<p>Prodigy Auth SMTP benchmark</p>', 'text/html')
+        return msg
+
+    def run_per_message(self, count, connection_kwargs):
+        """Previous behaviour: every send opens and closes its own connection"""
+        start = time.perf_counter()
+        for index in range(count):
+            connection = get_connection(SMTP_BACKEND, fail_silently=False, **connection_kwargs)
+            connection.send_messages([self.build_message(index)])
+        return count / (time.perf_counter() - start)
+
+    def run_pooled(self, count, pool):
+        """Every send borrows an already-open connection from the pool"""
+        start = time.perf_counter()
+        for index in range(count):
+            pool.send_messages([self.build_message(index)])
+        return count / (time.perf_counter() - start)
@@ -0,0 +1,114 @@
+"""
+Django management command to benchmark the token revocation check
+Usage: python manage.py benchmark_token_refresh [--blacklisted 100000] [--refreshes 2000]
+
+Reports Bloom filter size and measured false-positive rate per error rate, then
+times token refreshes with simplejwt's database blacklist check against the
+revocation index. Benchmark rows are rolled back at the end.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from accounts.revocation import BloomFilter, revocation_index
+from accounts.serializers import CustomTokenRefreshSerializer
+from accounts.tokens import RefreshToken
+import time
+import uuid
+
+User = get_user_model()
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Benchmark refresh throughput with the database blacklist check vs the revocation index'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--blacklisted', type=int, default=100000, help='Blacklisted JTIs to seed')
+        parser.add_argument('--refreshes', type=int, default=2000, help='Refreshes timed per run')
+        parser.add_argument('--error-rates', type=float, nargs='+', default=[0.1, 0.01, 0.001, 0.0001], help='Bloom filter error rates to compare')
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS('🚀 Token Revocation Benchmark'))
+        self.stdout.write('=' * 50)
+
+        self.tune_filter(options['blacklisted'], options['error_rates'])
+
+        try:
+            with transaction.atomic():
+                self.benchmark_refresh(options['blacklisted'], options['refreshes'])
+                raise Rollback()
+        except Rollback:
+            revocation_index.reset()
+            self.stdout.write('🧹 Benchmark tokens rolled back')
+
+        self.stdout.write(self.style.SUCCESS('✅ Benchmark completed!'))
+
+    def tune_filter(self, count, error_rates):
+        members = [uuid.uuid4().hex for _ in range(count)]
+        probes = [uuid.uuid4().hex for _ in range(100000)]
+
+        self.stdout.write(f"🎯 Bloom filter with {count:,} blacklisted JTIs, {len(probes):,} unrevoked probes")
+        self.stdout.write(f"   {'Target':>8}  {'Measured':>9}  {'Memory':>10}  {'Hashes':>6}  {'Lookup':>8}")
+        for error_rate in error_rates:
+            bloom = BloomFilter(count, error_rate)
+            for jti in members:
+                bloom.add(jti)
+
+            start = time.perf_counter()
+            false_positives = sum(1 for jti in probes if jti in bloom)
+            lookup_us = (time.perf_counter() - start) / len(probes) * 1e6
+
+            self.stdout.write(
+                f"   {error_rate:>8.4%}  {false_positives / len(probes):>9.4%}  "
+                f"{bloom.memory_bytes / 1024:>8,.0f}KB  {bloom.hash_count:>6}  {lookup_us:>6.2f}µs"
+            )
+        self.stdout.write('')
+
+    def benchmark_refresh(self, blacklisted, refreshes):
+        user = User.objects.create_user(
+            email=f'refresh-bench-{uuid.uuid4().hex[:8]}@example.com',
+            username=f'refresh-bench-{uuid.uuid4().hex[:8]}',
+            password='benchmark-password'
+        )
+
+        start = time.perf_counter()
+        expires_at = timezone.now() + timezone.timedelta(days=1)
+        for offset in range(0, blacklisted, 5000):
+            outstanding = OutstandingToken.objects.bulk_create([
+                OutstandingToken(user=user, jti=uuid.uuid4().hex, token='', expires_at=expires_at)
+                for _ in range(min(5000, blacklisted - offset))
+            ])
+            BlacklistedToken.objects.bulk_create([BlacklistedToken(token=token) for token in outstanding])
+        self.stdout.write(f"🌱 Seeded {blacklisted:,} blacklisted tokens in {time.perf_counter() - start:.1f}s")
+
+        revocation_index.reset()
+        revocation_index.is_revoked('warm-up')
+
+        self.stdout.write(f"🔄 {refreshes:,} refreshes per run")
+        for label, serializer_class in (
+            ('Database blacklist check', TokenRefreshSerializer),
+            ('Revocation index', CustomTokenRefreshSerializer),
+        ):
+            tokens = [str(RefreshToken.for_user(user)) for _ in range(refreshes)]
+
+            queries = []
+            with connection.execute_wrapper(lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)):
+                start = time.perf_counter()
+                for token in tokens:
+                    serializer = serializer_class(data={'refresh': token})
+                    serializer.is_valid(raise_exception=True)
+                elapsed = time.perf_counter() - start
+
+            blacklist_checks = sum(1 for sql in queries if 'token_blacklist_blacklistedtoken' in sql)
+            self.stdout.write(
+                f"   {label:<26} {refreshes / elapsed:>8,.0f} refreshes/sec, "
+                f"{len(queries) / refreshes:.1f} queries/refresh ({blacklist_checks:,} blacklist lookups)"
+            )
+        self.stdout.write('')
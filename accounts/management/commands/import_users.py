@@ -0,0 +1,299 @@
+"""
+Django management command to bulk import users from a legacy system
+Usage: python manage.py import_users FILE [--format csv|jsonl] [--chunk-size N] [--workers N]
+                                          [--rejects FILE] [--dry-run]
+
+Input columns: email, username, password (plain text) or password_hash (an
+existing Django-format hash, stored as is), and optionally first_name,
+last_name, role, is_verified, is_active, date_joined. Rows without either
+password column get an unusable password and must reset it.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from accounts.stats import invalidate_dashboard_stats
+from accounts.user_cache import user_lookup
+import csv
+import json
+import os
+import time
+
+User = get_user_model()
+
+ROLES = {choice[0] for choice in User._meta.get_field('role').choices}
+# Checked per row: one over-long value would fail the whole chunk's INSERT on databases that enforce lengths
+MAX_LENGTHS = {field: User._meta.get_field(field).max_length for field in ('email', 'username', 'password')}
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 't'}
+
+# Read as text; JSONL numbers are accepted as their string form
+TEXT_FIELDS = ('email', 'username', 'password', 'password_hash', 'first_name', 'last_name', 'role', 'date_joined')
+
+
+def init_hashing_worker(settings_module):
+    """Configure Django in each pool process so make_password uses our hashers"""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    import django
+    django.setup()
+
+
+def hash_passwords(passwords):
+    """Hash a slice of passwords in a pool process (None -> unusable password)"""
+    return [make_password(password) for password in passwords]
+
+
+def read_csv(path):
+    with open(path, newline='', encoding='utf-8') as handle:
+        for line_number, row in enumerate(csv.DictReader(handle), start=2):
+            yield line_number, row
+
+
+def read_jsonl(path):
+    with open(path, encoding='utf-8') as handle:
+        for line_number, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError:
+                yield line_number, None
+
+
+def text_fields(row):
+    """Copy of row with TEXT_FIELDS as strings ('' if missing), or None if one is not a scalar"""
+    cleaned = dict(row)
+    for field in TEXT_FIELDS:
+        value = row.get(field)
+        if value is None:
+            cleaned[field] = ''
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            cleaned[field] = str(value)
+        elif not isinstance(value, str):
+            return None
+    return cleaned
+
+
+def parse_date_joined(value):
+    """Aware datetime, or None if empty; raises ValueError if invalid (including 2024-02-30)"""
+    value = value.strip()
+    if not value:
+        return None
+    moment = parse_datetime(value)
+    if moment is None:
+        raise ValueError(f'Invalid datetime: {value}')
+    return moment if timezone.is_aware(moment) else timezone.make_aware(moment)
+
+
+def to_bool(value, default):
+    if value is None or value == '':
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in TRUE_VALUES
+
+
+class Command(BaseCommand):
+    help = 'Stream users from CSV/JSONL into the database with parallel password hashing'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', type=str, help='CSV or JSONL file to import')
+        parser.add_argument('--format', choices=['csv', 'jsonl'], default=None, help='Input format (default: from the file extension)')
+        parser.add_argument('--chunk-size', type=int, default=5000, help='Rows validated, hashed and inserted together')
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Password hashing processes')
+        parser.add_argument('--rejects', type=str, default=None, help='Write rejected rows and reasons to this CSV file')
+        parser.add_argument('--dry-run', action='store_true', help='Validate without hashing or inserting')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f'File not found: {path}')
+
+        input_format = options['format'] or ('jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv')
+        rows = read_jsonl(path) if input_format == 'jsonl' else read_csv(path)
+
+        self.stdout.write(self.style.SUCCESS('📥 Importing users'))
+        self.stdout.write('=' * 50)
+        self.stdout.write(f"📄 {path} ({input_format}), chunks of {options['chunk_size']:,}, {options['workers']} hashing workers")
+
+        self.rejects_file = open(options['rejects'], 'w', newline='', encoding='utf-8') if options['rejects'] else None
+        self.rejects_writer = csv.writer(self.rejects_file) if self.rejects_file else None
+        if self.rejects_writer:
+            self.rejects_writer.writerow(['line', 'email', 'username', 'reason'])
+
+        self.imported = 0
+        self.rejected = {}
+        start = time.perf_counter()
+
+        executor = None
+        if not options['dry_run']:
+            executor = ProcessPoolExecutor(
+                max_workers=options['workers'],
+                initializer=init_hashing_worker,
+                initargs=(os.environ.get('DJANGO_SETTINGS_MODULE', 'prodigy_auth.settings'),)
+            )
+
+        try:
+            chunk = []
+            for line_number, row in rows:
+                chunk.append((line_number, row))
+                if len(chunk) >= options['chunk_size']:
+                    self.import_chunk(chunk, executor, options['workers'], options['dry_run'], start)
+                    chunk = []
+            if chunk:
+                self.import_chunk(chunk, executor, options['workers'], options['dry_run'], start)
+        finally:
+            if executor:
+                executor.shutdown()
+            if self.rejects_file:
+                self.rejects_file.close()
+
+        if self.imported:
+            invalidate_dashboard_stats()
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write('')
+        self.stdout.write(f"✅ {'Validated' if options['dry_run'] else 'Imported'}: {self.imported:,} users")
+        for reason, count in sorted(self.rejected.items()):
+            self.stdout.write(f"❌ Rejected ({reason}): {count:,}")
+        self.stdout.write(self.style.SUCCESS(
+            f"⏱️  {elapsed:.1f}s ({self.imported / max(elapsed, 1e-9):,.0f} users/sec)"
+        ))
+
+    def reject(self, line_number, row, reason):
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        if self.rejects_writer:
+            row = row or {}
+            self.rejects_writer.writerow([line_number, row.get('email', ''), row.get('username', ''), reason])
+
+    def clean_chunk(self, chunk):
+        """Per-row checks, then one query each for existing emails and usernames"""
+        candidates = []
+        seen_emails = set()
+        seen_usernames = set()
+
+        for line_number, row in chunk:
+            if not isinstance(row, dict):
+                self.reject(line_number, None, 'unparseable row')
+                continue
+
+            cleaned = text_fields(row)
+            if cleaned is None:
+                self.reject(line_number, row, 'invalid field type')
+                continue
+            row = cleaned
+
+            email = User.objects.normalize_email(row['email'].strip())
+            username = User.normalize_username(row['username'].strip())
+            try:
+                validate_email(email)
+            except ValidationError:
+                self.reject(line_number, row, 'invalid email')
+                continue
+            if len(email) > MAX_LENGTHS['email']:
+                self.reject(line_number, row, 'email too long')
+                continue
+            if not username:
+                self.reject(line_number, row, 'missing username')
+                continue
+            if len(username) > MAX_LENGTHS['username']:
+                self.reject(line_number, row, 'username too long')
+                continue
+            try:
+                User.username_validator(username)
+            except ValidationError:
+                self.reject(line_number, row, 'invalid username')
+                continue
+            if email.lower() in seen_emails or username in seen_usernames:
+                self.reject(line_number, row, 'duplicate in file')
+                continue
+
+            role = row['role'].strip() or 'user'
+            if role not in ROLES:
+                self.reject(line_number, row, 'invalid role')
+                continue
+
+            password_hash = row['password_hash'] or None
+            if password_hash:
+                try:
+                    identify_hasher(password_hash)
+                except ValueError:
+                    self.reject(line_number, row, 'unrecognised password hash')
+                    continue
+                if len(password_hash) > MAX_LENGTHS['password']:
+                    self.reject(line_number, row, 'password hash too long')
+                    continue
+
+            try:
+                date_joined = parse_date_joined(row['date_joined'])
+            except ValueError:
+                self.reject(line_number, row, 'invalid date_joined')
+                continue
+
+            seen_emails.add(email.lower())
+            seen_usernames.add(username)
+            candidates.append((line_number, row, email, username, role, password_hash, date_joined))
+
+        existing_emails = {
+            email.lower() for email in
+            User.objects.filter(email__in=[c[2] for c in candidates]).values_list('email', flat=True)
+        }
+        existing_usernames = set(
+            User.objects.filter(username__in=[c[3] for c in candidates]).values_list('username', flat=True)
+        )
+
+        valid = []
+        for candidate in candidates:
+            line_number, row, email, username = candidate[:4]
+            if email.lower() in existing_emails:
+                self.reject(line_number, row, 'email exists')
+            elif username in existing_usernames:
+                self.reject(line_number, row, 'username exists')
+            else:
+                valid.append(candidate)
+        return valid
+
+    def import_chunk(self, chunk, executor, workers, dry_run, start):
+        valid = self.clean_chunk(chunk)
+        if dry_run or not valid:
+            self.imported += len(valid) if dry_run else 0
+            return
+
+        # Hash plain-text passwords across the pool; existing hashes pass through
+        to_hash = [(index, row['password'] or None) for index, (_, row, _, _, _, password_hash, _) in enumerate(valid) if not password_hash]
+        passwords = [password for _, password in to_hash]
+        slice_size = max(len(passwords) // (workers * 4), 1)
+        slices = [passwords[i:i + slice_size] for i in range(0, len(passwords), slice_size)]
+        hashed = [password for result in executor.map(hash_passwords, slices) for password in result]
+        hashes = {index: password for (index, _), password in zip(to_hash, hashed)}
+
+        users = []
+        for index, (_, row, email, username, role, password_hash, date_joined) in enumerate(valid):
+            user = User(
+                email=email,
+                username=username,
+                password=password_hash or hashes[index],
+                first_name=row['first_name'][:150],
+                last_name=row['last_name'][:150],
+                role=role,
+                is_verified=to_bool(row.get('is_verified'), False),
+                is_active=to_bool(row.get('is_active'), True),
+            )
+            if date_joined:
+                user.date_joined = date_joined
+            users.append(user)
+
+        with transaction.atomic():
+            User.objects.bulk_create(users, batch_size=1000)
+        # bulk_create sends no post_save; drop cached misses for the new addresses
+        user_lookup.invalidate_many(users)
+
+        self.imported += len(users)
+        elapsed = time.perf_counter() - start
+        self.stdout.write(f"   ... {self.imported:,} users imported ({self.imported / elapsed:,.0f} users/sec)")
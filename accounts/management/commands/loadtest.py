@@ -0,0 +1,166 @@
+"""
+Django management command to load test a running server
+Usage: python manage.py loadtest URL [--concurrency 1000] [--requests 20000]
+                                     [--email E --password P] [--method GET] [--data JSON]
+
+Opens --concurrency keep-alive connections and sends --requests requests in
+total, then reports throughput and latency percentiles. With --email and
+--password it logs in first and sends the access token as a Bearer header.
+Run it against the same endpoint served by gunicorn (WSGI) and uvicorn (ASGI)
+to compare the two, e.g. /api/auth/2fa-status/ and /api/async/auth/2fa-status/.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from urllib.parse import urlsplit
+import asyncio
+import json
+import resource
+import time
+
+
+class Connection:
+    """Minimal HTTP/1.1 keep-alive client; reconnects when the server closes"""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, raw):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.writer.write(raw)
+        await self.writer.drain()
+
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        status = int(lines[0].split()[1])
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            body = await self.read_chunked()
+        else:
+            body = await self.reader.readexactly(int(headers.get('content-length', 0)))
+        if headers.get('connection', '').lower() == 'close':
+            self.close()
+        return status, body
+
+    async def read_chunked(self):
+        chunks = []
+        while True:
+            size = int((await self.reader.readuntil(b'\r\n')).split(b';')[0], 16)
+            chunk = await self.reader.readexactly(size + 2)
+            if not size:
+                return b''.join(chunks)
+            chunks.append(chunk[:-2])
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+def build_request(method, host, path, headers, body=b''):
+    lines = [f'{method} {path} HTTP/1.1', f'Host: {host}', 'Connection: keep-alive']
+    lines += [f'{name}: {value}' for name, value in headers.items()]
+    if body:
+        lines += ['Content-Type: application/json', f'Content-Length: {len(body)}']
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+
+class Command(BaseCommand):
+    help = 'Measure requests/sec and latency percentiles of a running server'
+
+    def add_arguments(self, parser):
+        parser.add_argument('url', type=str, help='Endpoint to load, e.g. http://127.0.0.1:8000/api/async/auth/2fa-status/')
+        parser.add_argument('--concurrency', type=int, default=1000, help='Concurrent keep-alive clients')
+        parser.add_argument('--requests', type=int, default=20000, help='Total requests to send')
+        parser.add_argument('--method', type=str, default='GET', help='HTTP method')
+        parser.add_argument('--data', type=str, default='', help='JSON request body')
+        parser.add_argument('--email', type=str, default=None, help='Log in as this user and send a Bearer token')
+        parser.add_argument('--password', type=str, default=None, help='Password for --email')
+        parser.add_argument('--login-path', type=str, default='/api/auth/login/', help='Login endpoint used with --email')
+
+    def handle(self, *args, **options):
+        url = urlsplit(options['url'])
+        if url.scheme != 'http' or not url.hostname:
+            raise CommandError('Only plain http:// URLs are supported')
+
+        # Every client holds a socket; make sure the process may open them all
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        wanted = options['concurrency'] + 64
+        if soft < wanted:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (min(wanted, hard), hard))
+
+        self.stdout.write(self.style.SUCCESS('🔥 Load Test'))
+        self.stdout.write('=' * 50)
+        self.stdout.write(
+            f"🎯 {options['method']} {options['url']}: {options['requests']:,} requests, "
+            f"{options['concurrency']:,} concurrent clients"
+        )
+
+        results = asyncio.run(self.run(url, options))
+        self.report(*results)
+
+    async def run(self, url, options):
+        host, port = url.hostname, url.port or 80
+        headers = {}
+
+        if options['email']:
+            login = json.dumps({'email': options['email'], 'password': options['password']}).encode()
+            connection = Connection(host, port)
+            status, body = await connection.request(build_request('POST', url.netloc, options['login_path'], {}, login))
+            connection.close()
+            if status != 200:
+                raise CommandError(f'Login failed with {status}: {body[:200]!r}')
+            headers['Authorization'] = f"Bearer {json.loads(body)['access']}"
+
+        raw = build_request(options['method'].upper(), url.netloc, url.path or '/', headers, options['data'].encode())
+        remaining = [options['requests']]
+        latencies = []
+        statuses = {}
+        errors = {}
+
+        async def client():
+            connection = Connection(host, port)
+            while remaining[0] > 0:
+                remaining[0] -= 1
+                started = time.perf_counter()
+                try:
+                    status, _ = await connection.request(raw)
+                except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+                    errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+                    connection.close()
+                    continue
+                latencies.append(time.perf_counter() - started)
+                statuses[status] = statuses.get(status, 0) + 1
+            connection.close()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(options['concurrency'])))
+        return time.perf_counter() - start, sorted(latencies), statuses, errors
+
+    def report(self, elapsed, latencies, statuses, errors):
+        self.stdout.write('')
+        self.stdout.write(f"✅ Completed: {len(latencies):,} responses in {elapsed:.1f}s")
+        for status, count in sorted(statuses.items()):
+            self.stdout.write(f"   HTTP {status}: {count:,}")
+        for error, count in sorted(errors.items()):
+            self.stdout.write(f"❌ {error}: {count:,}")
+        self.stdout.write(self.style.SUCCESS(
+            f"⏱️  {len(latencies) / max(elapsed, 1e-9):,.0f} req/sec, "
+            f"p50 {percentile(latencies, 0.50) * 1000:.1f}ms, "
+            f"p99 {percentile(latencies, 0.99) * 1000:.1f}ms, "
+            f"max {(latencies[-1] if latencies else 0) * 1000:.1f}ms"
+        ))
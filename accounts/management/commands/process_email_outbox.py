@@ -0,0 +1,63 @@
+"""
+Django management command to deliver queued transactional emails
+Usage: python manage.py process_email_outbox [--once] [--batch-size N] [--interval SECONDS]
+"""
+
+from django.core.management.base import BaseCommand
+from accounts.outbox import process_outbox
+from accounts.smtp_pool import smtp_pool
+import time
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued emails from the outbox with retries and dead-lettering'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process due messages once and exit instead of polling'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=50,
+            help='Number of messages to lease per batch'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help='Seconds to sleep when the outbox is empty'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        interval = options['interval']
+
+        self.stdout.write(self.style.SUCCESS('📬 Email outbox worker started'))
+
+        try:
+            while True:
+                stats = process_outbox(batch_size=batch_size)
+                processed = sum(stats.values())
+
+                if processed:
+                    self.stdout.write(
+                        f"📨 Sent {stats['sent']}, retrying {stats['retried']}, dead-lettered {stats['dead']}"
+                    )
+
+                if options['once']:
+                    # Drain everything that is currently due, then exit
+                    if processed:
+                        continue
+                    break
+
+                if not processed:
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            smtp_pool.close_idle()
+
+        self.stdout.write(self.style.SUCCESS('✅ Email outbox worker stopped'))
@@ -0,0 +1,43 @@
+"""
+Django management command to purge expired JWT bookkeeping rows
+Usage: python manage.py purge_tokens [--batch-size N] [--pause SECONDS] [--dry-run]
+"""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from accounts.purge import purge_expired_tokens
+
+
+class Command(BaseCommand):
+    help = 'Delete expired OutstandingToken and BlacklistedToken rows in bounded batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None, help='Outstanding tokens deleted per transaction')
+        parser.add_argument('--pause', type=float, default=None, help='Seconds to sleep between batches')
+        parser.add_argument('--max-batches', type=int, default=None, help='Stop after this many batches')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many rows are expired')
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS('🧹 Purging expired tokens'))
+        self.stdout.write('=' * 50)
+
+        expired = OutstandingToken.objects.filter(expires_at__lt=timezone.now())
+        self.stdout.write(f"📊 Outstanding tokens: {OutstandingToken.objects.count():,} ({expired.count():,} expired)")
+        self.stdout.write(f"📊 Blacklisted tokens: {BlacklistedToken.objects.count():,}")
+
+        if options['dry_run']:
+            return
+
+        result = purge_expired_tokens(
+            batch_size=options['batch_size'],
+            pause=options['pause'],
+            max_batches=options['max_batches'],
+        )
+
+        self.stdout.write('')
+        self.stdout.write(f"🗑️  Outstanding deleted: {result['outstanding_deleted']:,}")
+        self.stdout.write(f"🗑️  Blacklisted deleted: {result['blacklisted_deleted']:,}")
+        self.stdout.write(f"⏱️  {result['batches']} batches in {result['elapsed']:.1f}s ({result['rows_per_second']:,} rows/sec)")
+        self.stdout.write(f"📊 Outstanding tokens remaining: {OutstandingToken.objects.count():,}")
+        self.stdout.write(self.style.SUCCESS('✅ Purge completed!'))
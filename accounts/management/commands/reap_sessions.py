@@ -0,0 +1,52 @@
+"""
+Django management command to expire and archive stale user sessions
+Usage: python manage.py reap_sessions [--retention-days N] [--batch-size N] [--pause SECONDS] [--dry-run]
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from accounts.models import UserSession
+from accounts.reaper import reap_sessions, session_table_sizes
+
+
+class Command(BaseCommand):
+    help = 'Deactivate sessions past the refresh token lifetime and archive old inactive sessions'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retention-days', type=int, default=None, help='Keep inactive sessions this many days before archiving')
+        parser.add_argument('--batch-size', type=int, default=None, help='Rows handled per batch')
+        parser.add_argument('--pause', type=float, default=None, help='Seconds to sleep between batches')
+        parser.add_argument('--dry-run', action='store_true', help='Only report table sizes and what is due')
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS('🧹 Reaping user sessions'))
+        self.stdout.write('=' * 50)
+
+        if options['dry_run']:
+            sizes = session_table_sizes()
+            expired_cutoff = timezone.now() - settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME']
+            retention_days = options['retention_days'] or getattr(settings, 'SESSION_ARCHIVE_AFTER_DAYS', 30)
+            archive_cutoff = timezone.now() - timezone.timedelta(days=retention_days)
+            self.write_sizes('Current', sizes)
+            self.stdout.write(f"⏳ Due for deactivation: {UserSession.objects.filter(is_active=True, last_activity__lt=expired_cutoff).count():,}")
+            self.stdout.write(f"📦 Due for archiving: {UserSession.objects.filter(is_active=False, last_activity__lt=archive_cutoff).count():,}")
+            return
+
+        result = reap_sessions(
+            batch_size=options['batch_size'],
+            pause=options['pause'],
+            retention_days=options['retention_days'],
+        )
+
+        self.write_sizes('Before', result['before'])
+        self.stdout.write(f"⏳ Deactivated: {result['deactivated']:,}")
+        self.stdout.write(f"📦 Archived: {result['archived']:,} in {result['elapsed']:.1f}s")
+        self.write_sizes('After', result['after'])
+        self.stdout.write(self.style.SUCCESS('✅ Session reaping completed!'))
+
+    def write_sizes(self, label, sizes):
+        self.stdout.write(
+            f"📊 {label}: {sizes['active']:,} active, {sizes['inactive']:,} inactive, "
+            f"{sizes['archived']:,} archived sessions"
+        )
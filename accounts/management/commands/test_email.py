@@ -6,10 +6,13 @@ Usage: python manage.py test_email [email_address]
 from django.core.management.base import BaseCommand
 from django.conf import settings
 from django.core.mail import send_mail
-from accounts.email_service import email_service
+from accounts.email_service import ProdigyEmailService
 from accounts.models import CustomUser
 import uuid
 
+# Bypass the outbox so delivery problems surface immediately
+email_service = ProdigyEmailService(use_outbox=False)
+
 class Command(BaseCommand):
     help = 'Test the email system configuration and templates'
 
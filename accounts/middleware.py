@@ -3,10 +3,10 @@ Custom Rate Limiting Middleware for Prodigy Auth
 Implements IP-based rate limiting without decorator conflicts
 """
 
-import time
-from django.core.cache import cache
 from django.http import JsonResponse
 from django.utils.deprecation import MiddlewareMixin
+from .activity import SESSION_ID_CLAIM, session_activity
+from .ratelimit import rate_limiter
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,6 +19,7 @@ class RateLimitMiddleware(MiddlewareMixin):
     # Rate limit configurations
     RATE_LIMITS = {
         '/api/auth/login/': {'requests': 5, 'window': 300},  # 5 requests per 5 minutes
+        '/api/async/auth/login/': {'requests': 5, 'window': 300},  # Same budget as the sync login
         # '/api/auth/forgot-password/': {'requests': 2, 'window': 3600},  # REMOVED - No rate limiting
         '/api/auth/reset-password/': {'requests': 5, 'window': 3600},  # 5 requests per hour
         '/api/auth/register/': {'requests': 3, 'window': 3600},  # 3 requests per hour
@@ -48,31 +49,18 @@ class RateLimitMiddleware(MiddlewareMixin):
         # Get rate limit config for this endpoint
         config = self.RATE_LIMITS[path]
         
-        # Create cache key
-        cache_key = f"rate_limit:{ip_address}:{path}"
+        # Sliding-window counter check (one cache get + one atomic incr)
+        allowed, retry_after = rate_limiter.hit(
+            f"{ip_address}:{path}", config['requests'], config['window']
+        )
         
-        # Get current request count
-        current_requests = cache.get(cache_key, [])
-        now = time.time()
-        
-        # Remove old requests outside the window
-        window_start = now - config['window']
-        current_requests = [req_time for req_time in current_requests if req_time > window_start]
-        
-        # Check if rate limit exceeded
-        if len(current_requests) >= config['requests']:
+        if not allowed:
             logger.warning(f"Rate limit exceeded for IP {ip_address} on {path}")
             return JsonResponse({
                 'error': 'Rate limit exceeded. Please try again later.',
-                'retry_after': int(config['window'] - (now - min(current_requests)))
+                'retry_after': retry_after
             }, status=429)
         
-        # Add current request
-        current_requests.append(now)
-        
-        # Update cache
-        cache.set(cache_key, current_requests, config['window'])
-        
         return None
     
     def get_client_ip(self, request):
@@ -82,4 +70,25 @@ class RateLimitMiddleware(MiddlewareMixin):
             ip = x_forwarded_for.split(',')[0].strip()
         else:
             ip = request.META.get('REMOTE_ADDR')
-        return ip
\ No newline at end of file
+        return ip
+
+
+class SessionActivityMiddleware(MiddlewareMixin):
+    """
+    Record activity for the UserSession behind each JWT-authenticated request
+    
+    DRF authenticates inside the view and copies request.auth onto the Django
+    request, so the token is only available once the response is built.
+    """
+    
+    def process_response(self, request, response):
+        token = getattr(request, 'auth', None)
+        session_key = token.get(SESSION_ID_CLAIM) if hasattr(token, 'get') else None
+        
+        if session_key:
+            try:
+                session_activity.touch(session_key)
+            except Exception as e:
+                logger.error(f"Failed to record session activity: {e}")
+        
+        return response
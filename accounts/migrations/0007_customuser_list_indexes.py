@@ -0,0 +1,30 @@
+# Generated by Django 5.1.1 on 2026-10-17 01:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_alter_auditlog_timestamp'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['date_joined', 'id'], name='accounts_cu_date_jo_ccd5cd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['role', 'date_joined', 'id'], name='accounts_cu_role_594c44_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['is_verified', 'date_joined', 'id'], name='accounts_cu_is_veri_5ec7c9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['is_active', 'date_joined', 'id'], name='accounts_cu_is_acti_7a8c3a_idx'),
+        ),
+    ]
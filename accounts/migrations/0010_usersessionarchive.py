@@ -0,0 +1,43 @@
+# Generated by Django 5.1.1 on 2026-10-17 01:44
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_usersession_last_activity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserSessionArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('session_key', models.CharField(max_length=40)),
+                ('ip_address', models.GenericIPAddressField()),
+                ('user_agent', models.TextField()),
+                ('created_at', models.DateTimeField()),
+                ('last_activity', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-last_activity'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='usersession',
+            index=models.Index(fields=['is_active', 'last_activity'], name='accounts_us_is_acti_0c63b7_idx'),
+        ),
+        migrations.AddField(
+            model_name='usersessionarchive',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='usersessionarchive',
+            index=models.Index(fields=['user', 'last_activity'], name='accounts_us_user_id_57f755_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.1 on 2026-10-17 02:20
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils.crypto import salted_hmac
+
+
+def hash_existing_codes(apps, schema_editor):
+    # Same keyed hash as accounts.backup_codes.hash_backup_code, inlined so
+    # later changes to that module cannot change what this migration does
+    TwoFactorBackupCode = apps.get_model('accounts', 'TwoFactorBackupCode')
+    secret = getattr(settings, 'BACKUP_CODE_HASH_KEY', None) or settings.SECRET_KEY
+
+    codes = list(TwoFactorBackupCode.objects.only('id', 'code'))
+    for backup_code in codes:
+        normalized = ''.join(backup_code.code.split()).replace('-', '').upper()
+        backup_code.code_hash = salted_hmac('accounts.backup_codes', normalized, secret=secret, algorithm='sha256').hexdigest()
+    TwoFactorBackupCode.objects.bulk_update(codes, ['code_hash'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_usersessionarchive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='twofactorbackupcode',
+            name='code_hash',
+            field=models.CharField(default='', max_length=64),
+            preserve_default=False,
+        ),
+        # Plaintext codes cannot be recovered from their hashes
+        migrations.RunPython(hash_existing_codes, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='twofactorbackupcode',
+            unique_together={('user', 'code_hash')},
+        ),
+        migrations.RemoveField(
+            model_name='twofactorbackupcode',
+            name='code',
+        ),
+    ]
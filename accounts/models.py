@@ -17,6 +17,7 @@ class CustomUser(AbstractUser):
     last_login_ip = models.GenericIPAddressField(null=True, blank=True)
     failed_login_attempts = models.IntegerField(default=0)
     account_locked_until = models.DateTimeField(null=True, blank=True)
+    token_version = models.PositiveIntegerField(default=0)  # Bumped to revoke every issued JWT
     
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
@@ -46,9 +47,9 @@ class CustomUser(AbstractUser):
         return False
     
     def lock_account(self, duration_minutes=30):
-        """Lock account for specified duration"""
+        """Lock account for specified duration, saving the failed attempt count with it"""
         self.account_locked_until = timezone.now() + timezone.timedelta(minutes=duration_minutes)
-        self.save(update_fields=['account_locked_until'])
+        self.save(update_fields=['failed_login_attempts', 'account_locked_until'])
     
     def unlock_account(self):
         """Unlock account and reset failed attempts"""
@@ -59,6 +60,13 @@ class CustomUser(AbstractUser):
     class Meta:
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            # Keyset pagination of the admin users list, unfiltered and per filter
+            models.Index(fields=['date_joined', 'id']),
+            models.Index(fields=['role', 'date_joined', 'id']),
+            models.Index(fields=['is_verified', 'date_joined', 'id']),
+            models.Index(fields=['is_active', 'date_joined', 'id']),
+        ]
 
 class AuditLog(models.Model):
     """Audit logging for compliance and security monitoring"""
@@ -85,7 +93,7 @@ class AuditLog(models.Model):
     
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, null=True, blank=True)
     action = models.CharField(max_length=50, choices=ACTION_CHOICES)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now)  # Event time, not flush time
     ip_address = models.GenericIPAddressField()
     user_agent = models.TextField(blank=True)
     details = models.JSONField(default=dict, blank=True)
@@ -119,7 +127,7 @@ class UserSession(models.Model):
     ip_address = models.GenericIPAddressField()
     user_agent = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
-    last_activity = models.DateTimeField(auto_now=True)
+    last_activity = models.DateTimeField(default=timezone.now)  # Written by SessionActivityMiddleware
     is_active = models.BooleanField(default=True)
     
     class Meta:
@@ -127,22 +135,44 @@ class UserSession(models.Model):
         indexes = [
             models.Index(fields=['user', 'is_active']),
             models.Index(fields=['session_key']),
+            models.Index(fields=['is_active', 'last_activity']),  # Session reaper
         ]
     
     def __str__(self):
         return f"{self.user.email} - {self.ip_address} - {self.created_at}"
 
+class UserSessionArchive(models.Model):
+    """Ended sessions moved out of UserSession after the retention window"""
+    
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
+    session_key = models.CharField(max_length=40)
+    ip_address = models.GenericIPAddressField()
+    user_agent = models.TextField()
+    created_at = models.DateTimeField()
+    last_activity = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-last_activity']
+        indexes = [
+            models.Index(fields=['user', 'last_activity']),
+        ]
+    
+    def __str__(self):
+        return f"{self.user_id} - {self.ip_address} - {self.created_at} (archived)"
+
 class TwoFactorBackupCode(models.Model):
-    """Backup codes for 2FA recovery"""
+    """Backup codes for 2FA recovery, stored as keyed hashes (see accounts.backup_codes)"""
     
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
-    code = models.CharField(max_length=10)
+    code_hash = models.CharField(max_length=64)
     used = models.BooleanField(default=False)
     used_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
-        unique_together = ['user', 'code']
+        # Also the (user, code_hash) index redemption looks codes up by
+        unique_together = ['user', 'code_hash']
         indexes = [
             models.Index(fields=['user', 'used']),
         ]
@@ -151,4 +181,37 @@ class TwoFactorBackupCode(models.Model):
         """Mark backup code as used"""
         self.used = True
         self.used_at = timezone.now()
-        self.save(update_fields=['used', 'used_at'])
\ No newline at end of file
+        self.save(update_fields=['used', 'used_at'])
+
+class OutboundEmail(models.Model):
+    """Transactional email outbox, delivered by the process_email_outbox worker"""
+    
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('dead', 'Dead Letter'),
+    ]
+    
+    subject = models.CharField(max_length=255)
+    from_email = models.CharField(max_length=255)
+    to = models.JSONField(default=list)
+    body_text = models.TextField()
+    body_html = models.TextField(blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    lease_token = models.CharField(max_length=32, blank=True)
+    leased_until = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+    
+    def __str__(self):
+        return f"{', '.join(self.to)} - {self.subject} - {self.status}"
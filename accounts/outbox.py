@@ -0,0 +1,196 @@
+"""
+Transactional Email Outbox for Prodigy Auth
+Queues rendered emails in the database and delivers them from a worker process
+"""
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.db.models import Q
+from django.utils import timezone
+from datetime import timedelta
+from .models import OutboundEmail
+from .smtp_pool import smtp_pool
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+def _to_outbound(msg):
+    """Convert a rendered EmailMultiAlternatives message into an unsaved outbox row"""
+    html_content = ''
+    for content, mimetype in msg.alternatives:
+        if mimetype == 'text/html':
+            html_content = content
+            break
+
+    return OutboundEmail(
+        subject=msg.subject,
+        from_email=msg.from_email,
+        to=list(msg.to),
+        body_text=msg.body,
+        body_html=html_content,
+    )
+
+
+def enqueue_message(msg):
+    """Store a rendered EmailMultiAlternatives message in the outbox"""
+    outbound = _to_outbound(msg)
+    outbound.save()
+    return outbound
+
+
+async def aenqueue_message(msg):
+    """Async enqueue_message() for ASGI views"""
+    outbound = _to_outbound(msg)
+    await outbound.asave()
+    return outbound
+
+
+def enqueue_messages(messages, batch_size=500):
+    """Store many rendered messages in the outbox with bulk inserts"""
+    outbound = [_to_outbound(msg) for msg in messages]
+    OutboundEmail.objects.bulk_create(outbound, batch_size=batch_size)
+    return len(outbound)
+
+
+def build_message(outbound):
+    """Rebuild an EmailMultiAlternatives message from an outbox row"""
+    msg = EmailMultiAlternatives(
+        subject=outbound.subject,
+        body=outbound.body_text,
+        from_email=outbound.from_email,
+        to=outbound.to
+    )
+    if outbound.body_html:
+        msg.attach_alternative(outbound.body_html, "text/html")
+    return msg
+
+
+def get_retry_delay(attempts):
+    """Exponential backoff delay in seconds for the given attempt number"""
+    base = getattr(settings, 'EMAIL_OUTBOX_RETRY_BACKOFF', 60)
+    ceiling = getattr(settings, 'EMAIL_OUTBOX_MAX_BACKOFF', 3600)
+    return min(base * (2 ** max(attempts - 1, 0)), ceiling)
+
+
+def claim_batch(batch_size=50):
+    """
+    Lease a batch of due messages for this worker
+
+    Messages stuck in 'sending' past their lease (e.g. a crashed worker) are
+    claimed again, so delivery is at-least-once.
+    """
+    now = timezone.now()
+    lease_seconds = getattr(settings, 'EMAIL_OUTBOX_LEASE_SECONDS', 300)
+    due = (
+        Q(status='pending', next_attempt_at__lte=now) |
+        Q(status='sending', leased_until__lt=now)
+    )
+
+    candidate_ids = list(
+        OutboundEmail.objects.filter(due)
+        .order_by('next_attempt_at')
+        .values_list('id', flat=True)[:batch_size]
+    )
+    if not candidate_ids:
+        return []
+
+    # Conditional update so concurrent workers never lease the same row twice
+    lease_token = uuid.uuid4().hex
+    OutboundEmail.objects.filter(due, id__in=candidate_ids).update(
+        status='sending',
+        lease_token=lease_token,
+        leased_until=now + timedelta(seconds=lease_seconds)
+    )
+    return list(OutboundEmail.objects.filter(lease_token=lease_token, status='sending'))
+
+
+def mark_sent(outbound):
+    """
+    Record a successful delivery
+
+    The bodies are cleared: they hold reset links, verification links and
+    temporary passwords that must not outlive delivery.
+    """
+    outbound.status = 'sent'
+    outbound.attempts += 1
+    outbound.sent_at = timezone.now()
+    outbound.lease_token = ''
+    outbound.leased_until = None
+    outbound.body_text = ''
+    outbound.body_html = ''
+    outbound.save(update_fields=[
+        'status', 'attempts', 'sent_at', 'lease_token', 'leased_until', 'body_text', 'body_html'
+    ])
+
+
+def mark_failed(outbound, error):
+    """Schedule a retry with backoff, or dead-letter after the final attempt"""
+    max_attempts = getattr(settings, 'EMAIL_OUTBOX_MAX_ATTEMPTS', 5)
+
+    outbound.attempts += 1
+    outbound.last_error = str(error)
+    outbound.lease_token = ''
+    outbound.leased_until = None
+
+    if outbound.attempts >= max_attempts:
+        outbound.status = 'dead'
+        logger.error(f"Outbound email {outbound.id} to {outbound.to} dead-lettered after {outbound.attempts} attempts: {error}")
+    else:
+        outbound.status = 'pending'
+        outbound.next_attempt_at = timezone.now() + timedelta(seconds=get_retry_delay(outbound.attempts))
+        logger.warning(f"Outbound email {outbound.id} to {outbound.to} failed (attempt {outbound.attempts}), retrying: {error}")
+
+    outbound.save(update_fields=[
+        'status', 'attempts', 'last_error', 'next_attempt_at', 'lease_token', 'leased_until'
+    ])
+
+
+def process_outbox(batch_size=50):
+    """
+    Deliver one batch of due messages
+
+    Returns a dict with the number of messages sent, retried and dead-lettered.
+    """
+    stats = {'sent': 0, 'retried': 0, 'dead': 0}
+    batch = claim_batch(batch_size)
+
+    # Pooled connections stay open between batches and are shared with inline sends
+    for outbound in batch:
+        try:
+            smtp_pool.send_messages([build_message(outbound)])
+            mark_sent(outbound)
+            stats['sent'] += 1
+        except Exception as e:
+            mark_failed(outbound, e)
+            stats['dead' if outbound.status == 'dead' else 'retried'] += 1
+
+    return stats
+
+
+def purge_outbox(retention=None):
+    """
+    Delete sent and dead-lettered messages older than EMAIL_OUTBOX_RETENTION
+
+    Also clears any bodies still stored on sent rows (e.g. rows delivered
+    before mark_sent cleared them). Run periodically by the scheduler.
+    """
+    retention = retention or getattr(settings, 'EMAIL_OUTBOX_RETENTION', 7 * 24 * 60 * 60)
+    cleared = OutboundEmail.objects.filter(status='sent').exclude(body_text='', body_html='').update(body_text='', body_html='')
+    deleted = OutboundEmail.objects.filter(
+        status__in=['sent', 'dead'],
+        created_at__lt=timezone.now() - timedelta(seconds=retention)
+    ).delete()[0]
+    return {'bodies_cleared': cleared, 'deleted': deleted}
+
+
+def requeue_dead_letters(queryset=None):
+    """Move dead-lettered messages back to pending with a fresh attempt budget"""
+    if queryset is None:
+        queryset = OutboundEmail.objects.all()
+    return queryset.filter(status='dead').update(
+        status='pending',
+        attempts=0,
+        next_attempt_at=timezone.now()
+    )
@@ -0,0 +1,105 @@
+"""
+Keyset Pagination for Prodigy Auth
+Opaque (date_joined, id) cursors for newest-first user listings
+"""
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+import base64
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor cannot be decoded"""
+    pass
+
+
+def encode_cursor(date_joined, pk):
+    raw = f"{date_joined.isoformat()}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Return the (date_joined, id) position a cursor points after"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        date_part, pk_part = raw.rsplit('|', 1)
+        date_joined = parse_datetime(date_part)
+        pk = int(pk_part)
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidCursor(cursor)
+
+    if date_joined is None:
+        raise InvalidCursor(cursor)
+    return date_joined, pk
+
+
+def parse_page_size(value):
+    try:
+        page_size = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+
+def keyset_page(queryset, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """
+    One page of `queryset` ordered newest first, plus the cursor for the next
+
+    Seeks past the cursor position with a (date_joined, id) comparison instead
+    of OFFSET, so every page costs one index range scan regardless of depth.
+    Fetches page_size + 1 rows to learn whether another page exists.
+    """
+    queryset = queryset.order_by('-date_joined', '-id')
+
+    if cursor:
+        date_joined, pk = decode_cursor(cursor)
+        # The redundant date_joined <= bound lets the planner seek the
+        # (date_joined, id) index instead of scanning it up to the cursor
+        queryset = queryset.filter(date_joined__lte=date_joined).filter(
+            Q(date_joined__lt=date_joined) | Q(date_joined=date_joined, id__lt=pk)
+        )
+
+    rows = list(queryset[:page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    next_cursor = encode_cursor(rows[-1].date_joined, rows[-1].pk) if has_more else None
+    return rows, next_cursor
+
+
+def parse_bool(value):
+    """'true'/'1'/'yes' -> True, 'false'/'0'/'no' -> False, anything else -> None"""
+    if value is None:
+        return None
+    value = value.strip().lower()
+    if value in ('true', '1', 'yes'):
+        return True
+    if value in ('false', '0', 'no'):
+        return False
+    return None
+
+
+def filter_users(queryset, params):
+    """Apply the admin list filters: role, verified, active, locked"""
+    role = params.get('role')
+    if role:
+        queryset = queryset.filter(role=role)
+
+    verified = parse_bool(params.get('verified'))
+    if verified is not None:
+        queryset = queryset.filter(is_verified=verified)
+
+    active = parse_bool(params.get('active'))
+    if active is not None:
+        queryset = queryset.filter(is_active=active)
+
+    locked = parse_bool(params.get('locked'))
+    if locked is not None:
+        locked_q = Q(account_locked_until__gt=timezone.now())
+        queryset = queryset.filter(locked_q if locked else ~locked_q)
+
+    return queryset
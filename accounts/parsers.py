@@ -0,0 +1,32 @@
+"""
+JSON Parser for Prodigy Auth
+orjson-backed drop-in for DRF's JSONParser, with the stdlib decoder as fallback
+"""
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from .renderers import orjson, FastJSONRenderer
+
+
+class FastJSONParser(JSONParser):
+    """
+    JSONParser decoding request bodies with orjson
+
+    orjson only reads UTF-8 and, like DRF's strict mode, rejects NaN and
+    Infinity. Bodies declared in another charset, and installs without
+    orjson, go through the stdlib parser.
+    """
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        if orjson is None or encoding.lower().replace('-', '') != 'utf8':
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
@@ -0,0 +1,56 @@
+"""
+Token Purging for Prodigy Auth
+Delete expired OutstandingToken/BlacklistedToken rows in bounded batches
+"""
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+import time
+
+
+def purge_expired_tokens(batch_size=None, pause=None, max_batches=None):
+    """
+    Delete outstanding tokens past expires_at, with their blacklist entries
+
+    Works in batches of `batch_size` ids, each in its own short transaction,
+    sleeping `pause` seconds between batches so SQLite writers are not starved.
+    Expired tokens fail signature validation anyway, so their blacklist rows
+    are no longer needed. Returns counts and the rows/sec achieved.
+    """
+    batch_size = batch_size or getattr(settings, 'TOKEN_PURGE_BATCH_SIZE', 1000)
+    pause = getattr(settings, 'TOKEN_PURGE_BATCH_PAUSE', 0.05) if pause is None else pause
+    cutoff = timezone.now()
+
+    outstanding_deleted = 0
+    blacklisted_deleted = 0
+    batches = 0
+    start = time.perf_counter()
+
+    while max_batches is None or batches < max_batches:
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lt=cutoff).values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+
+        with transaction.atomic():
+            blacklisted_deleted += BlacklistedToken.objects.filter(token_id__in=ids).delete()[0]
+            outstanding_deleted += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+        batches += 1
+
+        if len(ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    elapsed = time.perf_counter() - start
+    removed = outstanding_deleted + blacklisted_deleted
+    return {
+        'outstanding_deleted': outstanding_deleted,
+        'blacklisted_deleted': blacklisted_deleted,
+        'batches': batches,
+        'elapsed': round(elapsed, 3),
+        'rows_per_second': round(removed / elapsed) if elapsed else 0,
+    }
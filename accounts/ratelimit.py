@@ -0,0 +1,84 @@
+"""
+Rate Limiting Engine for Prodigy Auth
+Sliding-window counters built on atomic cache operations
+"""
+
+from django.core.cache import cache as default_cache
+import math
+import time
+
+
+class SlidingWindowRateLimiter:
+    """
+    Approximate sliding-window limiter using two fixed-window counters
+
+    Each key keeps one integer per fixed window. The request rate is estimated
+    as the previous window's count, weighted by how much of it still overlaps
+    the sliding window, plus the current window's count. A check costs one
+    `get` and one atomic `incr`, and memory per key is constant regardless of
+    the limit. Rejected requests are counted too, so clients that keep
+    hammering stay blocked until they back off.
+    """
+
+    def __init__(self, cache=None, prefix='rate_limit'):
+        self.cache = cache or default_cache
+        self.prefix = prefix
+
+    def _increment(self, key, timeout):
+        """Atomically increment a counter, creating it if needed"""
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # Counter missing; add() is atomic so only one concurrent caller creates it
+            if self.cache.add(key, 1, timeout):
+                return 1
+            return self.cache.incr(key)
+
+    def hit(self, key, limit, window, now=None):
+        """
+        Record a request and decide whether it is allowed
+
+        Returns (allowed, retry_after) where retry_after is the number of
+        seconds until the estimated rate drops below the limit (0 if allowed).
+        """
+        now = time.time() if now is None else now
+        current_window = int(now // window)
+        elapsed = now - current_window * window
+
+        current_key = f"{self.prefix}:{key}:{current_window}"
+        previous_key = f"{self.prefix}:{key}:{current_window - 1}"
+
+        previous_count = self.cache.get(previous_key, 0)
+        # Counters live for two windows so the next window can weight this one
+        current_count = self._increment(current_key, window * 2)
+
+        overlap = (window - elapsed) / window
+        estimated = previous_count * overlap + current_count
+
+        if estimated <= limit:
+            return True, 0
+
+        return False, self._retry_after(previous_count, current_count, limit, window, elapsed)
+
+    def _retry_after(self, previous_count, current_count, limit, window, elapsed):
+        """Seconds until the weighted count falls back under the limit"""
+        if current_count >= limit or not previous_count:
+            # Only the next window resets the current counter
+            wait = window - elapsed
+        else:
+            # Solve previous * (window - elapsed - t) / window + current <= limit for t
+            wait = (window - elapsed) - (limit - current_count) * window / previous_count
+        return max(1, math.ceil(wait))
+
+    def reset(self, key, window, now=None):
+        """Clear both counters for a key"""
+        now = time.time() if now is None else now
+        current_window = int(now // window)
+        self.cache.delete_many([
+            f"{self.prefix}:{key}:{current_window}",
+            f"{self.prefix}:{key}:{current_window - 1}",
+        ])
+
+
+# Global instance
+rate_limiter = SlidingWindowRateLimiter()
@@ -0,0 +1,93 @@
+"""
+Session Reaper for Prodigy Auth
+Expire stale UserSession rows and archive ended ones in bounded batches
+"""
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from .models import UserSession, UserSessionArchive
+import time
+
+ARCHIVE_FIELDS = ('user_id', 'session_key', 'ip_address', 'user_agent', 'created_at', 'last_activity')
+
+
+def session_table_sizes():
+    return {
+        'active': UserSession.objects.filter(is_active=True).count(),
+        'inactive': UserSession.objects.filter(is_active=False).count(),
+        'archived': UserSessionArchive.objects.count(),
+    }
+
+
+def deactivate_expired_sessions(batch_size, pause):
+    """
+    Mark sessions idle for longer than the refresh token lifetime inactive
+
+    No refresh token issued to such a session can still be valid, so the
+    session can no longer be used.
+    """
+    cutoff = timezone.now() - settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME']
+    deactivated = 0
+
+    while True:
+        ids = list(
+            UserSession.objects.filter(is_active=True, last_activity__lt=cutoff).values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        deactivated += UserSession.objects.filter(id__in=ids).update(is_active=False)
+        if len(ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    return deactivated
+
+
+def archive_inactive_sessions(batch_size, pause, retention_days):
+    """Move inactive sessions last used before the retention window to the archive"""
+    cutoff = timezone.now() - timezone.timedelta(days=retention_days)
+    archived = 0
+
+    while True:
+        rows = list(
+            UserSession.objects.filter(is_active=False, last_activity__lt=cutoff)
+            .values('id', *ARCHIVE_FIELDS)[:batch_size]
+        )
+        if not rows:
+            break
+
+        with transaction.atomic():
+            UserSessionArchive.objects.bulk_create([
+                UserSessionArchive(**{field: row[field] for field in ARCHIVE_FIELDS}) for row in rows
+            ])
+            UserSession.objects.filter(id__in=[row['id'] for row in rows]).delete()
+        archived += len(rows)
+
+        if len(rows) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    return archived
+
+
+def reap_sessions(batch_size=None, pause=None, retention_days=None):
+    """Deactivate expired sessions, then archive old inactive ones; returns a report"""
+    batch_size = batch_size or getattr(settings, 'SESSION_REAPER_BATCH_SIZE', 1000)
+    pause = getattr(settings, 'SESSION_REAPER_BATCH_PAUSE', 0.05) if pause is None else pause
+    retention_days = retention_days or getattr(settings, 'SESSION_ARCHIVE_AFTER_DAYS', 30)
+
+    start = time.perf_counter()
+    before = session_table_sizes()
+    deactivated = deactivate_expired_sessions(batch_size, pause)
+    archived = archive_inactive_sessions(batch_size, pause, retention_days)
+
+    return {
+        'deactivated': deactivated,
+        'archived': archived,
+        'before': before,
+        'after': session_table_sizes(),
+        'elapsed': round(time.perf_counter() - start, 3),
+    }
@@ -0,0 +1,65 @@
+"""
+JSON Renderer for Prodigy Auth
+orjson-backed drop-in for DRF's JSONRenderer, with the stdlib encoder as fallback
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# With OPT_UTC_Z, orjson writes datetimes, dates and times exactly as DRF's
+# encoder does (isoformat(), `Z` for UTC) for every whole-minute UTC offset;
+# only historical local-mean-time offsets with seconds would be rounded
+ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+# Raw U+2028/U+2029 are valid JSON but end a line in older JavaScript parsers
+LINE_SEPARATOR = '\u2028'.encode()
+PARAGRAPH_SEPARATOR = '\u2029'.encode()
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer producing the same bytes with orjson, several times faster
+
+    Datetimes and UUIDs are written natively in the same format as before
+    (ISO 8601 with `Z` for UTC, canonical UUID strings). Anything else
+    orjson does not know (Decimals, lazy strings, querysets, sets) goes
+    through DRF's own JSONEncoder.default, so Decimals still render as
+    floats.
+    Indented output (the browsable API, `Accept: ...; indent=4`), ASCII-only
+    or non-compact output (UNICODE_JSON / COMPACT_JSON turned off), payloads
+    orjson rejects (integers beyond 64 bits) and installs without orjson use
+    the stdlib path unchanged.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if not self.uses_orjson(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=encoders.JSONEncoder().default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError as e:
+            logger.debug(f"orjson could not render response, using stdlib encoder: {e}")
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if LINE_SEPARATOR in ret or PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(LINE_SEPARATOR, b'\\u2028').replace(PARAGRAPH_SEPARATOR, b'\\u2029')
+        return ret
+
+    def uses_orjson(self, accepted_media_type, renderer_context):
+        return (
+            orjson is not None
+            and self.compact
+            and not self.ensure_ascii
+            and self.get_indent(accepted_media_type, renderer_context) is None
+        )
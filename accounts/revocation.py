@@ -0,0 +1,263 @@
+"""
+Token Revocation Index for Prodigy Auth
+Per-process Bloom filter of blacklisted JTIs in front of the BlacklistedToken table
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from .user_cache import user_lookup
+import hashlib
+import logging
+import math
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+REVOCATION_VERSION_KEY = 'token_revocation:version'
+
+# Claim carrying the user's token_version at issue time
+TOKEN_VERSION_CLAIM = 'ver'
+
+# Re-read rows blacklisted this long before the last sync, so rows committed
+# out of timestamp order by concurrent writers are not missed
+SYNC_OVERLAP = timezone.timedelta(seconds=60)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter sized for `capacity` items at `error_rate`
+
+    Uses m = -n ln(p) / ln(2)^2 bits and k = (m / n) ln(2) hash functions,
+    derived from one blake2b digest by double hashing.
+    """
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = max(int(capacity), 1)
+        self.error_rate = error_rate
+        self.size = max(int(-self.capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hash_count = max(int(round(self.size / self.capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, item):
+        added = False
+        for position in self._positions(item):
+            mask = 1 << (position & 7)
+            if not self.bits[position >> 3] & mask:
+                self.bits[position >> 3] |= mask
+                added = True
+        # Re-adding a known item (e.g. from overlapping syncs) does not count
+        if added:
+            self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    @property
+    def memory_bytes(self):
+        return len(self.bits)
+
+
+class RevocationIndex:
+    """
+    Answers "is this JTI blacklisted?" without the database in the common case
+
+    A JTI missing from the filter is definitely not blacklisted; a hit (a real
+    revocation or a false positive) is confirmed against BlacklistedToken.
+    The filter is synced incrementally from BlacklistedToken.blacklisted_at
+    whenever the shared revocation version in the cache moves, and at least
+    every TOKEN_REVOCATION_SYNC_INTERVAL seconds for caches that are not shared
+    between processes. It is rebuilt from unexpired rows when it fills up or
+    every TOKEN_REVOCATION_REBUILD_INTERVAL seconds, dropping expired JTIs.
+    """
+
+    def __init__(self, capacity=None, error_rate=None, sync_interval=None, rebuild_interval=None):
+        self.capacity = capacity or getattr(settings, 'TOKEN_REVOCATION_BLOOM_CAPACITY', 100000)
+        self.error_rate = error_rate or getattr(settings, 'TOKEN_REVOCATION_BLOOM_ERROR_RATE', 0.001)
+        self.sync_interval = sync_interval if sync_interval is not None else getattr(settings, 'TOKEN_REVOCATION_SYNC_INTERVAL', 5)
+        self.rebuild_interval = rebuild_interval or getattr(settings, 'TOKEN_REVOCATION_REBUILD_INTERVAL', 60 * 60)
+
+        self._lock = threading.Lock()
+        self._filter = None
+        self._synced_through = None
+        self._version = None
+        self._next_sync = 0
+        self._next_rebuild = 0
+        self.database_checks = 0
+
+    def is_revoked(self, jti):
+        if jti not in self._maybe_sync():
+            return False
+
+        self.database_checks += 1
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    def add(self, jti):
+        """Record a JTI this process just blacklisted and tell other processes"""
+        bloom = self._maybe_sync()
+        with self._lock:
+            bloom.add(jti)
+        try:
+            cache.incr(REVOCATION_VERSION_KEY)
+        except ValueError:
+            cache.add(REVOCATION_VERSION_KEY, 1, None)
+
+    def reset(self):
+        with self._lock:
+            self._filter = None
+
+    def _maybe_sync(self):
+        """Bring the filter up to date if it is due, and return it"""
+        now = time.monotonic()
+        version = cache.get(REVOCATION_VERSION_KEY)
+        bloom = self._filter
+        if bloom is not None and version == self._version and now < self._next_sync:
+            return bloom
+
+        with self._lock:
+            if self._filter is None or now >= self._next_rebuild or self._filter.count >= self._filter.capacity:
+                self._rebuild(now)
+            else:
+                self._sync()
+            self._version = version
+            self._next_sync = now + self.sync_interval
+            return self._filter
+
+    def _rebuild(self, now):
+        started = timezone.now()
+        jtis = list(
+            BlacklistedToken.objects.filter(token__expires_at__gt=started).values_list('token__jti', flat=True)
+        )
+        # Leave headroom so a growing blacklist does not force a rebuild per sync
+        capacity = max(self.capacity, len(jtis) * 2)
+
+        bloom = BloomFilter(capacity, self.error_rate)
+        for jti in jtis:
+            bloom.add(jti)
+
+        self._filter = bloom
+        self._synced_through = started
+        self._next_rebuild = now + self.rebuild_interval
+        logger.info(f"Token revocation filter rebuilt: {len(jtis)} JTIs, {bloom.memory_bytes:,} bytes, {bloom.hash_count} hashes")
+
+    def _sync(self):
+        started = timezone.now()
+        jtis = BlacklistedToken.objects.filter(
+            blacklisted_at__gte=self._synced_through - SYNC_OVERLAP
+        ).values_list('token__jti', flat=True)
+
+        for jti in jtis:
+            self._filter.add(jti)
+        self._synced_through = started
+
+
+revocation_index = RevocationIndex()
+
+
+# Per-user token versions
+#
+# Every token carries the user's token_version when it was issued. Bumping the
+# version revokes all of the user's tokens at once; single access tokens are
+# revoked with a cache entry that lives until the token would expire anyway.
+# Cached versions expire after TOKEN_VERSION_CACHE_TTL seconds, so even a
+# process that missed a bump (a cache not shared between workers) re-reads
+# the user row within that bound.
+
+def token_version_ttl():
+    return getattr(settings, 'TOKEN_VERSION_CACHE_TTL', 60)
+
+
+def token_version_key(user_id):
+    return f'token_version:{user_id}'
+
+
+def revoked_token_key(jti):
+    return f'revoked_jti:{jti}'
+
+
+def get_token_version(user_id):
+    """Current token_version for a user, read through the cache"""
+    version = cache.get(token_version_key(user_id))
+    if version is None:
+        version = _load_token_version(user_id)
+    return version
+
+
+def _load_token_version(user_id):
+    version = get_user_model().objects.filter(pk=user_id).values_list('token_version', flat=True).first() or 0
+    cache.add(token_version_key(user_id), version, token_version_ttl())
+    return version
+
+
+def bump_token_version(user):
+    """
+    Revoke every token issued to `user` so far
+
+    The counter lives on the user row so an evicted cache entry can never
+    resurrect old tokens; the cache is then set to the committed value.
+    Returns the new version, which is also stored on `user`.
+    """
+    User = get_user_model()
+    User.objects.filter(pk=user.pk).update(token_version=F('token_version') + 1)
+    user.token_version = User.objects.filter(pk=user.pk).values_list('token_version', flat=True).get()
+    cache.set(token_version_key(user.pk), user.token_version, token_version_ttl())
+    # A cached user with the old version would be issued tokens born revoked
+    user_lookup.invalidate(user)
+    return user.token_version
+
+
+def revoke_token(token):
+    """Revoke a single token until its expiry with one cache write"""
+    remaining = int(token['exp'] - time.time())
+    if remaining > 0:
+        cache.set(revoked_token_key(token[api_settings.JTI_CLAIM]), True, remaining + 1)
+
+
+def is_token_revoked(token):
+    """
+    True if `token` was revoked individually or by a token_version bump
+
+    Costs one cache round trip; the database is only read when the user's
+    version is not cached yet.
+    """
+    user_id = token.get(api_settings.USER_ID_CLAIM)
+    version_key = token_version_key(user_id)
+    revoked_key = revoked_token_key(token.get(api_settings.JTI_CLAIM))
+
+    cached = cache.get_many([version_key, revoked_key])
+    if cached.get(revoked_key):
+        return True
+
+    version = cached.get(version_key)
+    if version is None:
+        version = _load_token_version(user_id)
+    return token.get(TOKEN_VERSION_CLAIM, 0) < version
+
+
+async def ais_token_revoked(token):
+    """Async is_token_revoked() for ASGI views"""
+    user_id = token.get(api_settings.USER_ID_CLAIM)
+    version_key = token_version_key(user_id)
+    revoked_key = revoked_token_key(token.get(api_settings.JTI_CLAIM))
+
+    cached = await cache.aget_many([version_key, revoked_key])
+    if cached.get(revoked_key):
+        return True
+
+    version = cached.get(version_key)
+    if version is None:
+        version = await get_user_model().objects.filter(pk=user_id).values_list('token_version', flat=True).afirst() or 0
+        await cache.aadd(version_key, version, token_version_ttl())
+    return token.get(TOKEN_VERSION_CLAIM, 0) < version
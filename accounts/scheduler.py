@@ -0,0 +1,105 @@
+"""
+Periodic Jobs for Prodigy Auth
+Background thread that runs maintenance jobs inside the web process
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    def __init__(self, name, func, interval, exclusive=True):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.exclusive = exclusive
+        self.next_run = time.monotonic() + interval
+        self.runs = 0
+        self.failures = 0
+        self.last_result = None
+
+
+class PeriodicScheduler:
+    """
+    Runs registered jobs every `interval` seconds on one daemon thread
+
+    Started lazily by the first request (see accounts/signals.py), so
+    management commands never start it. Each run takes a cache lock for the
+    job's interval, so with a shared cache only one process runs a job per
+    interval; with the default local-memory cache every process runs its own.
+    """
+
+    def __init__(self):
+        self._jobs = {}
+        self._wakeup = threading.Event()
+        self._start_lock = threading.Lock()
+        self._thread = None
+
+    def register(self, name, func, interval, exclusive=True):
+        """
+        Run `func` every `interval` seconds
+
+        Exclusive jobs run in one process per interval; non-exclusive jobs
+        (e.g. flushing per-process buffers) run in every process.
+        """
+        self._jobs[name] = PeriodicJob(name, func, interval, exclusive)
+
+    def ensure_started(self):
+        if self._thread is not None or not self._jobs:
+            return
+        if not getattr(settings, 'PERIODIC_JOBS_ENABLED', True):
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='periodic-jobs', daemon=True)
+                self._thread.start()
+
+    def run_pending(self, now=None):
+        """Run every job that is due; returns the names of the jobs that ran"""
+        now = time.monotonic() if now is None else now
+        ran = []
+        for job in list(self._jobs.values()):
+            if now < job.next_run:
+                continue
+            job.next_run = now + job.interval
+
+            if job.exclusive and not cache.add(f'periodic_job:{job.name}', 1, job.interval):
+                continue  # Another process ran it this interval
+
+            try:
+                job.last_result = job.func()
+                job.runs += 1
+                ran.append(job.name)
+                logger.info(f"Periodic job {job.name} finished: {job.last_result}")
+            except Exception as e:
+                job.failures += 1
+                logger.error(f"Periodic job {job.name} failed: {e}")
+            finally:
+                close_old_connections()
+        return ran
+
+    def stats(self):
+        return {
+            name: {
+                'interval': job.interval,
+                'runs': job.runs,
+                'failures': job.failures,
+                'last_result': job.last_result,
+            } for name, job in self._jobs.items()
+        }
+
+    def _run(self):
+        while True:
+            next_run = min(job.next_run for job in self._jobs.values())
+            self._wakeup.wait(max(next_run - time.monotonic(), 1))
+            self.run_pending()
+
+
+# Global instance
+scheduler = PeriodicScheduler()
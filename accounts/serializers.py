@@ -1,8 +1,12 @@
-from rest_framework import serializers
+from rest_framework import exceptions, serializers
 from django.contrib.auth import get_user_model
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 from django.contrib.auth.password_validation import validate_password
 from .email_service import email_service
+from .login import AccountLocked, authenticate_credentials
+from .tokens import RefreshToken
+from .activity import SESSION_ID_CLAIM, session_activity
+from .user_cache import user_lookup
 
 User = get_user_model()
 
@@ -15,12 +19,12 @@ class RegisterSerializer(serializers.ModelSerializer):
         fields = ['email', 'username', 'password', 'password_confirm']
     
     def validate_email(self, value):
-        if User.objects.filter(email=value).exists():
+        if user_lookup.exists(email=value):
             raise serializers.ValidationError("Email already registered")
         return value
     
     def validate_username(self, value):
-        if User.objects.filter(username=value).exists():
+        if user_lookup.exists(username=value):
             raise serializers.ValidationError("Username already taken")
         return value
     
@@ -44,49 +48,50 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     username_field = User.USERNAME_FIELD
     
     def validate(self, attrs):
-        # Get user first to check account status
+        """
+        Check credentials with a single user lookup
+        
+        Tokens, last-login bookkeeping and the session are created afterwards by
+        complete_login() in one transaction.
+        """
         email = attrs.get(self.username_field)
-        try:
-            user = User.objects.get(email=email)
-            
-            # Check if account is locked
-            if user.is_account_locked():
-                raise serializers.ValidationError("Account temporarily locked due to multiple failed login attempts. Please try again later.")
-            
-        except User.DoesNotExist:
-            pass
         
         try:
-            data = super().validate(attrs)
-            
-            # Reset failed login attempts on successful login
-            if hasattr(self, 'user'):
-                self.user.unlock_account()
-                
-                # Add custom claims
-                data['user'] = {
-                    'id': self.user.id,
-                    'email': self.user.email,
-                    'username': self.user.username,
-                    'role': self.user.role,
-                    'is_verified': self.user.is_verified,
-                }
-            
-            return data
-            
-        except Exception as e:
-            # Increment failed login attempts
-            if email:
-                try:
-                    user = User.objects.get(email=email)
-                    user.failed_login_attempts += 1
-                    if user.failed_login_attempts >= 5:
-                        user.lock_account()
-                    else:
-                        user.save(update_fields=['failed_login_attempts'])
-                except User.DoesNotExist:
-                    pass
-            raise e
+            # Throttling runs first and raises LoginThrottled (429) on its own
+            user = authenticate_credentials(email, attrs.get('password'), self.context.get('ip_address'))
+        except AccountLocked:
+            raise serializers.ValidationError("Account temporarily locked due to multiple failed login attempts. Please try again later.")
+        
+        if user is None:
+            raise exceptions.AuthenticationFailed(
+                self.error_messages["no_active_account"],
+                "no_active_account",
+            )
+        
+        self.user = user
+        return {
+            'user': {
+                'id': user.id,
+                'email': user.email,
+                'username': user.username,
+                'role': user.role,
+                'is_verified': user.is_verified,
+            }
+        }
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """Token refresh that checks the blacklist through the revocation index"""
+    token_class = RefreshToken
+    
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        
+        # A refresh is session activity too; the reaper expires idle sessions
+        session_key = self.token_class(attrs['refresh'], verify=False).get(SESSION_ID_CLAIM)
+        if session_key:
+            session_activity.touch(session_key)
+        
+        return data
 
 class UserProfileSerializer(serializers.ModelSerializer):
     class Meta:
@@ -94,6 +99,13 @@ class UserProfileSerializer(serializers.ModelSerializer):
         fields = ['id', 'email', 'username', 'role', 'is_verified', 'date_joined', 'last_login']
         read_only_fields = ['id', 'email', 'date_joined', 'last_login']
 
+    def update(self, instance, validated_data):
+        # The instance may be a cached copy; write only the submitted columns
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=list(validated_data))
+        return instance
+
 class EmailVerificationSerializer(serializers.Serializer):
     token = serializers.UUIDField()
     
@@ -113,7 +125,7 @@ class ResendVerificationSerializer(serializers.Serializer):
     
     def validate_email(self, value):
         try:
-            user = User.objects.get(email=value)
+            user = user_lookup.get(email=value)
             if user.is_verified:
                 raise serializers.ValidationError("Email already verified")
             return value
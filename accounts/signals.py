@@ -0,0 +1,45 @@
+"""
+Signal Receivers for Prodigy Auth
+Keep cached data in step with user changes
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.signals import request_finished, request_started
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .scheduler import scheduler
+from .stats import STATS_FIELDS, invalidate_dashboard_stats
+from .user_cache import user_lookup
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, update_fields=None, **kwargs):
+    """Drop cached dashboard stats when a save can change a counter"""
+    if created or update_fields is None or STATS_FIELDS.intersection(update_fields):
+        invalidate_dashboard_stats()
+    # Also clears a cached miss for a newly registered email or username
+    user_lookup.invalidate(instance)
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    invalidate_dashboard_stats()
+    user_lookup.invalidate(instance)
+
+
+@receiver(request_started)
+def start_periodic_jobs(sender, **kwargs):
+    """Start the maintenance thread in serving processes only"""
+    scheduler.ensure_started()
+
+
+@receiver(request_started)
+def begin_user_lookup_scope(sender, **kwargs):
+    user_lookup.begin_request()
+
+
+@receiver(request_finished)
+def end_user_lookup_scope(sender, **kwargs):
+    user_lookup.end_request()
@@ -0,0 +1,130 @@
+"""
+SMTP Connection Pool for Prodigy Auth
+Reuses open email backend connections so TLS and AUTH are paid once per connection
+"""
+
+from contextlib import contextmanager
+from django.conf import settings
+from django.core.mail import get_connection
+import logging
+import smtplib
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class PoolExhausted(Exception):
+    """Raised when no pooled email connection becomes free in time"""
+    pass
+
+
+class SMTPConnectionPool:
+    """
+    Thread-safe pool of open email backend connections
+
+    Idle connections are closed after `idle_timeout` seconds and health-checked
+    with NOOP before reuse; a send that fails on a dead connection is retried
+    once on a fresh connection.
+    """
+
+    def __init__(self, size=None, idle_timeout=None, backend=None, **connection_kwargs):
+        self.size = size or getattr(settings, 'EMAIL_POOL_SIZE', 4)
+        self.idle_timeout = idle_timeout or getattr(settings, 'EMAIL_POOL_IDLE_TIMEOUT', 60)
+        self.backend = backend
+        self.connection_kwargs = connection_kwargs
+        self._idle = []  # (connection, last_used) pairs, most recently used last
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.size)
+
+    def _open(self):
+        """Open a new backend connection"""
+        connection = get_connection(self.backend, fail_silently=False, **self.connection_kwargs)
+        connection.open()
+        return connection
+
+    def _close(self, connection):
+        """Close a connection, ignoring errors from already-dead sockets"""
+        try:
+            connection.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled email connection: {e}")
+
+    def _is_healthy(self, connection):
+        """Check that a pooled SMTP connection is still usable"""
+        smtp = getattr(connection, 'connection', None)
+        if smtp is None:
+            # Non-SMTP backends (file, console, locmem) have nothing to check
+            return not hasattr(connection, 'connection')
+        try:
+            return smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _acquire(self):
+        """Take an idle healthy connection, or open a new one"""
+        timeout = getattr(settings, 'EMAIL_TIMEOUT', None) or 30
+        if not self._slots.acquire(timeout=timeout):
+            raise PoolExhausted('Timed out waiting for a pooled email connection')
+
+        try:
+            while True:
+                with self._lock:
+                    if not self._idle:
+                        break
+                    connection, last_used = self._idle.pop()
+
+                if time.monotonic() - last_used > self.idle_timeout or not self._is_healthy(connection):
+                    self._close(connection)
+                    continue
+                return connection
+
+            return self._open()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, connection, healthy=True):
+        """Return a connection to the pool, or close it if it is broken"""
+        try:
+            if healthy:
+                with self._lock:
+                    self._idle.append((connection, time.monotonic()))
+            else:
+                self._close(connection)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of the block"""
+        connection = self._acquire()
+        healthy = True
+        try:
+            yield connection
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            self._release(connection, healthy=healthy)
+
+    def send_messages(self, messages):
+        """Send messages over a pooled connection, reconnecting once on failure"""
+        try:
+            with self.connection() as connection:
+                return connection.send_messages(messages)
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError) as e:
+            logger.warning(f"Pooled email connection failed, reconnecting: {e}")
+            with self.connection() as connection:
+                return connection.send_messages(messages)
+
+    def close_idle(self):
+        """Close every idle connection in the pool"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            self._close(connection)
+
+
+# Global instance
+smtp_pool = SMTPConnectionPool()
@@ -0,0 +1,59 @@
+"""
+Tests for Prodigy Auth
+Query budgets on the login hot path
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from .instrumentation import QueryBudgetExceeded
+from .throttling import login_throttle
+from .user_cache import user_lookup
+
+User = get_user_model()
+
+
+# Strict mode makes the view's query_budget raise QueryBudgetExceeded
+@override_settings(QUERY_BUDGET_STRICT=True)
+class LoginQueryBudgetTests(TestCase):
+    email = 'budget@example.com'
+    password = 'Budget-Passw0rd!'
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        login_throttle.enabled = False
+        self.addCleanup(setattr, login_throttle, 'enabled', True)
+        self.user = User.objects.create_user(
+            email=self.email,
+            username='budget',
+            password=self.password,
+            is_verified=True
+        )
+        user_lookup.invalidate(self.user)
+
+    def login(self):
+        response = self.client.post(
+            '/api/auth/login/',
+            {'email': self.email, 'password': self.password},
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        return response
+
+    def test_login_cold_cache_within_budget(self):
+        self.assertIsNone(cache.get(user_lookup.cache_key('email', self.email)))
+        self.login()
+
+    def test_login_warm_cache_within_budget(self):
+        # Any earlier lookup by email (e.g. a failed login) leaves the user cached
+        user_lookup.find('email', self.email)
+        hits = user_lookup.hits
+        self.login()
+        self.assertGreater(user_lookup.hits, hits)
+
+    def test_budget_is_enforced(self):
+        with self.settings(LOGIN_QUERY_BUDGET=getattr(settings, 'LOGIN_QUERY_BUDGET', 4) - 1):
+            with self.assertRaises(QueryBudgetExceeded):
+                self.login()
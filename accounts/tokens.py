@@ -0,0 +1,78 @@
+"""
+JWT Tokens for Prodigy Auth
+simplejwt token classes backed by the in-process revocation index
+"""
+
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken as BaseRefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+from .activity import SESSION_ID_CLAIM
+from .revocation import TOKEN_VERSION_CLAIM, is_token_revoked, revocation_index
+
+
+class RefreshToken(BaseRefreshToken):
+    """Refresh token whose blacklist check usually skips the database"""
+
+    @classmethod
+    def for_user(cls, user, session_key=None):
+        """
+        New token for `user`, stamped with the user's token_version
+
+        `session_key` ties the token to a UserSession for activity tracking.
+        Access tokens derived from it copy both claims. The claims are set
+        before the outstanding-token row is written so the stored token
+        matches the one handed out.
+        """
+        token = cls._unsaved_for_user(user, session_key)
+        token.outstand()
+        return token
+
+    @classmethod
+    async def afor_user(cls, user, session_key=None):
+        """Async for_user() for ASGI views"""
+        token = cls._unsaved_for_user(user, session_key)
+        await token.aoutstand()
+        return token
+
+    @classmethod
+    def _unsaved_for_user(cls, user, session_key):
+        token = cls()
+        token[api_settings.USER_ID_CLAIM] = str(getattr(user, api_settings.USER_ID_FIELD))
+        token[TOKEN_VERSION_CLAIM] = user.token_version
+        if session_key:
+            token[SESSION_ID_CLAIM] = session_key
+        return token
+
+    def check_blacklist(self):
+        if revocation_index.is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError("Token is blacklisted")
+        if is_token_revoked(self.payload):
+            raise TokenError("Token has been revoked")
+
+    def blacklist(self):
+        result = super().blacklist()
+        revocation_index.add(self.payload[api_settings.JTI_CLAIM])
+        return result
+
+    def outstand(self):
+        """
+        Record a freshly issued or rotated token with a single INSERT
+
+        The token always has a new JTI, so simplejwt's user lookup and
+        get_or_create are not needed.
+        """
+        return OutstandingToken.objects.create(**self._outstanding_fields())
+
+    async def aoutstand(self):
+        return await OutstandingToken.objects.acreate(**self._outstanding_fields())
+
+    def _outstanding_fields(self):
+        return {
+            'user_id': self.payload.get(api_settings.USER_ID_CLAIM),
+            'jti': self.payload[api_settings.JTI_CLAIM],
+            'token': str(self),
+            'created_at': self.current_time,
+            'expires_at': datetime_from_epoch(self.payload['exp']),
+        }
@@ -6,6 +6,7 @@ from .views import (
     logout_view,
     admin_dashboard,
     admin_users_list,
+    admin_export_audit_logs,
     admin_send_verification,
     admin_toggle_user_status,
     admin_reset_failed_attempts,
@@ -68,6 +69,7 @@ urlpatterns = [
     # Admin endpoints
     path('admin/dashboard/', admin_dashboard, name='admin_dashboard'),
     path('admin/users/', admin_users_list, name='admin_users_list'),
+    path('admin/audit-logs/export/', admin_export_audit_logs, name='admin_export_audit_logs'),
     path('admin/send-verification/', admin_send_verification, name='admin_send_verification'),
     path('admin/toggle-user-status/', admin_toggle_user_status, name='admin_toggle_user_status'),
     path('admin/reset-failed-attempts/', admin_reset_failed_attempts, name='admin_reset_failed_attempts'),
@@ -0,0 +1,264 @@
+"""
+User Lookup Cache for Prodigy Auth
+Read-through cache of user lookups by email/username (including misses) and by id
+"""
+
+from asgiref.local import Local
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+import copy
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Cached in place of a user when the lookup found nothing
+MISSING = '__missing__'
+
+LOOKUP_FIELDS = ('email', 'username')
+
+# Never written to the shared cache; cached users load them from the row on access
+SECRET_FIELDS = ('password', 'otp_secret', 'verification_token')
+
+
+def shareable(user):
+    """
+    Copy of user to put in the cache, without its secret columns
+
+    The secrets are left deferred, so code that reads them (password checks,
+    2FA) loads them from the row on first access, and a save() without
+    update_fields cannot write them back.
+    """
+    snapshot = copy.copy(user)
+    for attname in SECRET_FIELDS + ('_password',):
+        snapshot.__dict__.pop(attname, None)
+    return snapshot
+
+
+def load_secrets(user):
+    """Load any deferred secret columns of a cached user with one query"""
+    deferred = [field for field in SECRET_FIELDS if field in user.get_deferred_fields()]
+    if deferred:
+        user.refresh_from_db(fields=deferred)
+
+
+async def aload_secrets(user):
+    deferred = [field for field in SECRET_FIELDS if field in user.get_deferred_fields()]
+    if deferred:
+        await user.arefresh_from_db(fields=deferred)
+
+
+class UserLookupCache:
+    """
+    Two-level cache for exact user lookups by email or username
+
+    Within a request, repeated lookups of the same value return the same
+    instance without touching the shared cache. Across requests, users are
+    kept for USER_LOOKUP_CACHE_TTL seconds and misses for
+    USER_LOOKUP_NEGATIVE_TTL seconds, so enumeration floods against unknown
+    addresses stop reaching the database. Entries are dropped by the
+    post_save / post_delete receivers and by the few queryset.update() calls
+    that change fields lookups depend on (see invalidate_many). A cached user
+    whose email or username no longer matches the key is treated as a miss,
+    which covers renames without tracking old values.
+
+    Users are also cached by primary key for token authentication (see
+    find_by_id), for AUTH_USER_CACHE_TTL seconds.
+
+    Cached copies never hold SECRET_FIELDS (see shareable). They may lag the
+    row by up to a TTL for columns written with queryset.update(), so code
+    that saves a looked-up user must pass update_fields.
+    """
+
+    def __init__(self, ttl=None, negative_ttl=None, id_ttl=None):
+        self.ttl = ttl or getattr(settings, 'USER_LOOKUP_CACHE_TTL', 60)
+        self.negative_ttl = negative_ttl or getattr(settings, 'USER_LOOKUP_NEGATIVE_TTL', 30)
+        self.id_ttl = id_ttl or getattr(settings, 'AUTH_USER_CACHE_TTL', 300)
+        self._local = Local()
+        self.hits = 0
+        self.misses = 0
+
+    def cache_key(self, field, value):
+        # Hashed so arbitrary input makes a safe, fixed-length cache key
+        return f"user_lookup:{field}:{hashlib.blake2b(str(value).encode(), digest_size=16).hexdigest()}"
+
+    def id_key(self, user_id):
+        return f'user_lookup:id:{user_id}'
+
+    # Request scope: only active between request_started and request_finished,
+    # so long-running threads (workers, the periodic job thread) never keep
+    # a stale per-thread copy
+
+    def begin_request(self):
+        self._local.users = {}
+
+    def end_request(self):
+        self._local.users = None
+
+    def _request_users(self):
+        return getattr(self._local, 'users', None)
+
+    def find(self, field, value):
+        """User whose `field` exactly equals `value`, or None"""
+        if field not in LOOKUP_FIELDS:
+            raise ValueError(f"Unsupported lookup field: {field}")
+        if not value:
+            return None
+
+        request_users = self._request_users()
+        key = self.cache_key(field, value)
+        if request_users is not None and key in request_users:
+            return request_users[key]
+
+        user = self._unpack(cache.get(key), field, value)
+        if user is None:
+            user = get_user_model().objects.filter(**{field: value}).first()
+            cache.set(key, shareable(user) if user else MISSING, self.ttl if user else self.negative_ttl)
+
+        if request_users is not None:
+            request_users[key] = user or None
+        return user or None
+
+    async def afind(self, field, value):
+        """Async find() for ASGI views"""
+        if field not in LOOKUP_FIELDS:
+            raise ValueError(f"Unsupported lookup field: {field}")
+        if not value:
+            return None
+
+        request_users = self._request_users()
+        key = self.cache_key(field, value)
+        if request_users is not None and key in request_users:
+            return request_users[key]
+
+        user = self._unpack(await cache.aget(key), field, value)
+        if user is None:
+            user = await get_user_model().objects.filter(**{field: value}).afirst()
+            await cache.aset(key, shareable(user) if user else MISSING, self.ttl if user else self.negative_ttl)
+
+        if request_users is not None:
+            request_users[key] = user or None
+        return user or None
+
+    def _unpack(self, cached, field, value):
+        """
+        Cached entry -> user, False for a cached miss, or None to query
+
+        A user renamed since it was cached no longer answers to this key.
+        """
+        if cached is None:
+            self.misses += 1
+            return None
+        if cached == MISSING:
+            self.hits += 1
+            return False
+        if getattr(cached, field) != value:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return cached
+
+    def find_by_id(self, user_id, token_version=None):
+        """
+        User with this primary key, or None; used to authenticate every API call
+
+        The entry is versioned by token_version: a cached user whose version
+        differs from the one in the presented token is stale (the version
+        was bumped since it was cached) and is read again. Misses are not
+        cached; tokens for deleted users are rare and fail anyway.
+        """
+        request_users = self._request_users()
+        key = self.id_key(user_id)
+        if request_users is not None and key in request_users:
+            return request_users[key]
+
+        user = self._unpack_versioned(cache.get(key), token_version)
+        if user is None:
+            user = get_user_model().objects.filter(pk=user_id).first()
+            if user is not None:
+                cache.set(key, shareable(user), self.id_ttl)
+
+        if request_users is not None and user is not None:
+            request_users[key] = user
+        return user
+
+    async def afind_by_id(self, user_id, token_version=None):
+        """Async find_by_id() for ASGI views"""
+        request_users = self._request_users()
+        key = self.id_key(user_id)
+        if request_users is not None and key in request_users:
+            return request_users[key]
+
+        user = self._unpack_versioned(await cache.aget(key), token_version)
+        if user is None:
+            user = await get_user_model().objects.filter(pk=user_id).afirst()
+            if user is not None:
+                await cache.aset(key, shareable(user), self.id_ttl)
+
+        if request_users is not None and user is not None:
+            request_users[key] = user
+        return user
+
+    def _unpack_versioned(self, cached, token_version):
+        if cached is None or (token_version is not None and cached.token_version != token_version):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return cached
+
+    def get(self, **lookup):
+        """Drop-in for User.objects.get(email=...) / get(username=...)"""
+        (field, value), = lookup.items()
+        user = self.find(field, value)
+        if user is None:
+            User = get_user_model()
+            raise User.DoesNotExist(f"User matching {field} does not exist.")
+        return user
+
+    def exists(self, **lookup):
+        (field, value), = lookup.items()
+        return self.find(field, value) is not None
+
+    def invalidate(self, user):
+        self.invalidate_many([user])
+
+    def invalidate_many(self, users):
+        """
+        Drop entries for these users' ids and current emails and usernames
+
+        Runs now and again on commit, so a reader that fetched the old row
+        before the writing transaction committed cannot re-cache it.
+        """
+        keys = []
+        for user in users:
+            if user.pk is not None:
+                keys.append(self.id_key(user.pk))
+            keys.extend(
+                self.cache_key(field, getattr(user, field))
+                for field in LOOKUP_FIELDS if getattr(user, field, None)
+            )
+        if not keys:
+            return
+
+        request_users = self._request_users()
+        if request_users:
+            for key in keys:
+                request_users.pop(key, None)
+
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'ttl': self.ttl,
+            'negative_ttl': self.negative_ttl,
+            'id_ttl': self.id_ttl,
+        }
+
+
+# Global instance
+user_lookup = UserLookupCache()
@@ -3,11 +3,10 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework_simplejwt.views import TokenObtainPairView
-from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import get_user_model, authenticate
 from django.utils import timezone
 from django.conf import settings
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.core.cache import cache
 from django.views.decorators.cache import never_cache
 from .serializers import (
@@ -19,12 +18,24 @@ from .serializers import (
 )
 from .permissions import IsAdminUser
 from .email_service import email_service
-from .audit import log_audit_event, log_login_attempt, log_admin_action, log_security_event
-from .models import UserSession, TwoFactorBackupCode
+from .hashing import password_hashing
+from .throttling import login_throttle, throttle_address
+from .lockout import failed_logins
+from .user_cache import user_lookup
+from .login import complete_login
+from .tokens import RefreshToken
+from .activity import SESSION_ID_CLAIM, session_activity
+from .revocation import bump_token_version, revoke_token
+from .instrumentation import query_budget
+from .scheduler import scheduler
+from .stats import get_dashboard_stats
+from .export import EXPORT_FORMATS, InvalidExportFilter, filter_audit_logs, stream_audit_logs
+from .pagination import InvalidCursor, filter_users, keyset_page, parse_page_size
+from .qr import QR_FORMATS, qr_codes
+from .backup_codes import generate_backup_codes, normalize_backup_code, redeem_backup_code
+from .audit import log_audit_event, log_login_attempt, log_admin_action, log_security_event, audit_buffer
+from .models import UserSession
 import pyotp
-import qrcode
-import io
-import base64
 import uuid
 import logging
 import secrets
@@ -34,6 +45,11 @@ logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
+ADMIN_USER_LIST_FIELDS = (
+    'id', 'email', 'username', 'role', 'is_verified', 'is_active', 'date_joined',
+    'last_login', 'failed_login_attempts', 'account_locked_until',
+)
+
 class RegisterView(generics.CreateAPIView):
     serializer_class = RegisterSerializer
     permission_classes = [AllowAny]
@@ -66,31 +82,21 @@ class RegisterView(generics.CreateAPIView):
 @permission_classes([AllowAny])
 def login_view(request):
     """Clean login view with audit logging"""
-    serializer = CustomTokenObtainPairSerializer(data=request.data)
-    
     # Get IP and user agent for logging
     ip_address = request.META.get('HTTP_X_FORWARDED_FOR', '').split(',')[0] or request.META.get('REMOTE_ADDR', '127.0.0.1')
     user_agent = request.META.get('HTTP_USER_AGENT', '')
     
-    if serializer.is_valid():
-        # Get user and create tokens
-        user = serializer.user
-        refresh = RefreshToken.for_user(user)
-        
-        # Update last login info
-        user.last_login = timezone.now()
-        user.last_login_ip = ip_address
-        user.save(update_fields=['last_login', 'last_login_ip'])
-        
-        # Create user session
-        session_key = str(uuid.uuid4())
-        UserSession.objects.create(
-            user=user,
-            session_key=session_key,
-            ip_address=ip_address,
-            user_agent=user_agent
-        )
-        
+    # The throttle keys on an address the client cannot spoof, unlike the audit IP above
+    serializer = CustomTokenObtainPairSerializer(data=request.data, context={'ip_address': throttle_address(request)})
+    
+    with query_budget(getattr(settings, 'LOGIN_QUERY_BUDGET', 4), 'login_view'):
+        is_valid = serializer.is_valid()
+        if is_valid:
+            # One user UPDATE plus token and session INSERTs in a single transaction
+            user = serializer.user
+            refresh, session_key = complete_login(user, ip_address, user_agent)
+    
+    if is_valid:
         # Log successful login
         log_login_attempt(
             user=user,
@@ -119,7 +125,7 @@ def login_view(request):
     user = None
     if email:
         try:
-            user = User.objects.get(email=email)
+            user = user_lookup.get(email=email)
         except User.DoesNotExist:
             pass
     
@@ -179,7 +185,7 @@ def resend_verification(request):
     serializer.is_valid(raise_exception=True)
     
     email = serializer.validated_data['email']
-    user = User.objects.get(email=email)
+    user = user_lookup.get(email=email)
     
     # Regenerate token and send email
     user.regenerate_verification_token()
@@ -222,39 +228,10 @@ def logout_view(request):
             except Exception as e:
                 logger.error(f"Failed to blacklist refresh token: {e}")
         
-        # Also blacklist the current access token from Authorization header
-        try:
-            # Get the access token from the Authorization header
-            auth_header = request.META.get('HTTP_AUTHORIZATION', '')
-            if auth_header.startswith('Bearer '):
-                access_token_str = auth_header.split(' ')[1]
-                
-                # Import the blacklist model directly
-                from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
-                from rest_framework_simplejwt.tokens import AccessToken
-                
-                try:
-                    # Create an AccessToken object and blacklist it
-                    access_token = AccessToken(access_token_str)
-                    
-                    # Get or create the outstanding token
-                    outstanding_token, created = OutstandingToken.objects.get_or_create(
-                        token=access_token_str,
-                        defaults={
-                            'user': request.user,
-                            'jti': access_token['jti'],
-                            'expires_at': access_token['exp']
-                        }
-                    )
-                    
-                    # Blacklist the token
-                    BlacklistedToken.objects.get_or_create(token=outstanding_token)
-                    logger.info(f"Blacklisted access token for user {request.user.email}")
-                    
-                except Exception as e:
-                    logger.warning(f"Could not blacklist access token: {e}")
-        except Exception as e:
-            logger.error(f"Error blacklisting access token: {e}")
+        # Revoke the current access token until it expires (one cache write)
+        if request.auth is not None:
+            revoke_token(request.auth)
+            logger.info(f"Revoked access token for user {request.user.email}")
         
         # Log logout
         log_audit_event(
@@ -281,39 +258,12 @@ def logout_view(request):
 @permission_classes([IsAdminUser])
 def admin_dashboard(request):
     """Admin dashboard with enhanced statistics"""
-    users_count = User.objects.count()
-    verified_users = User.objects.filter(is_verified=True).count()
-    unverified_users = users_count - verified_users
-    admin_users = User.objects.filter(role='admin').count()
-    locked_accounts = User.objects.filter(account_locked_until__gt=timezone.now()).count()
-    inactive_users = User.objects.filter(is_active=False).count()  # Add inactive users count
-    recent_registrations = User.objects.filter(
-        date_joined__gte=timezone.now() - timezone.timedelta(days=7)
-    ).count()
-    
-    # Get recent users for admin panel
-    recent_users = User.objects.order_by('-date_joined')[:5]
+    # One aggregate query at most, served from cache between user changes
+    dashboard = get_dashboard_stats()
     
     return Response({
-        'stats': {
-            'total_users': users_count,
-            'verified_users': verified_users,
-            'unverified_users': unverified_users,
-            'admin_users': admin_users,
-            'locked_accounts': locked_accounts,
-            'inactive_users': inactive_users,  # Add to response
-            'recent_registrations': recent_registrations,
-        },
-        'recent_users': [
-            {
-                'id': user.id,
-                'email': user.email,
-                'username': user.username,
-                'role': user.role,
-                'is_verified': user.is_verified,
-                'date_joined': user.date_joined,
-            } for user in recent_users
-        ],
+        'stats': dashboard['stats'],
+        'recent_users': dashboard['recent_users'],
         'message': f'Welcome Admin {request.user.username}!',
         'system_status': {
             'jwt_enabled': True,
@@ -322,17 +272,43 @@ def admin_dashboard(request):
             'cors_enabled': True,
             'smtp_configured': hasattr(settings, 'EMAIL_HOST_USER') and bool(settings.EMAIL_HOST_USER),
             'email_backend': settings.EMAIL_BACKEND,
+            'audit_buffer': audit_buffer.stats(),
+            'periodic_jobs': scheduler.stats(),
+            'password_hashing': password_hashing.stats(),
+            'login_throttle': login_throttle.stats(),
         }
     })
 
 @api_view(['GET'])
 @permission_classes([IsAdminUser])
 def admin_users_list(request):
-    """Get all users for admin management"""
-    users = User.objects.all().order_by('-date_joined')
+    """
+    Get users for admin management, newest first, one page at a time
+    
+    Query params: role, verified, active, locked (true/false), page_size
+    (max 200) and cursor (the next_cursor of the previous page).
+    """
+    users = filter_users(
+        User.objects.only(*ADMIN_USER_LIST_FIELDS),
+        request.query_params
+    )
+    
+    try:
+        page, next_cursor = keyset_page(
+            users,
+            cursor=request.query_params.get('cursor'),
+            page_size=parse_page_size(request.query_params.get('page_size'))
+        )
+    except InvalidCursor:
+        return Response({
+            'error': 'Invalid cursor'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Failed attempts are counted in the cache and written to the table lazily
+    live_failed_attempts = failed_logins.current_counts([user.id for user in page])
     
     users_data = []
-    for user in users:
+    for user in page:
         users_data.append({
             'id': user.id,
             'email': user.email,
@@ -342,16 +318,55 @@ def admin_users_list(request):
             'is_active': user.is_active,
             'date_joined': user.date_joined,
             'last_login': user.last_login,
-            'failed_login_attempts': user.failed_login_attempts,
+            'failed_login_attempts': live_failed_attempts.get(user.id, user.failed_login_attempts),
             'is_locked': user.is_account_locked(),
             'account_locked_until': user.account_locked_until,
         })
     
     return Response({
         'users': users_data,
-        'total_count': len(users_data)
+        'next_cursor': next_cursor,
+        'has_more': next_cursor is not None,
     })
 
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def admin_export_audit_logs(request):
+    """
+    Stream audit logs as CSV or NDJSON
+    
+    Query params: export_format (csv|ndjson), action (comma separated),
+    since, until (ISO date or datetime), user (id or email), ip.
+    """
+    export_format = request.query_params.get('export_format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return Response({
+            'error': f"export_format must be one of: {', '.join(EXPORT_FORMATS)}"
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        audit_logs = filter_audit_logs(
+            action=request.query_params.get('action'),
+            since=request.query_params.get('since'),
+            until=request.query_params.get('until'),
+            user=request.query_params.get('user'),
+            ip_address=request.query_params.get('ip'),
+        )
+    except InvalidExportFilter as e:
+        return Response({
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    logger.info(f"Audit log export ({export_format}) started by {request.user.email}: {dict(request.query_params)}")
+    
+    filename = f"audit_logs_{timezone.now().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+    response = StreamingHttpResponse(
+        stream_audit_logs(audit_logs, export_format),
+        content_type='text/csv' if export_format == 'csv' else 'application/x-ndjson'
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
 @api_view(['POST'])
 @permission_classes([IsAdminUser])
 def admin_send_verification(request):
@@ -453,7 +468,8 @@ def admin_reset_failed_attempts(request):
         user = User.objects.get(id=user_id)
         user.failed_login_attempts = 0
         user.account_locked_until = None
-        user.save()
+        user.save(update_fields=['failed_login_attempts', 'account_locked_until'])
+        failed_logins.reset([user.id])
         
         return Response({
             'message': f'Failed login attempts reset for {user.email}'
@@ -581,7 +597,7 @@ def user_stats(request):
             'date_joined': user.date_joined,
             'last_login': user.last_login,
             'last_login_ip': user.last_login_ip,
-            'failed_login_attempts': user.failed_login_attempts,
+            'failed_login_attempts': failed_logins.current_counts([user.id]).get(user.id, user.failed_login_attempts),
             'is_locked': user.is_account_locked(),
         }
     })
@@ -614,14 +630,14 @@ def change_password(request):
     user = request.user
     
     # Verify current password
-    if not user.check_password(current_password):
+    if not password_hashing.check_password(user, current_password):
         return Response({
             'error': 'Current password is incorrect'
         }, status=status.HTTP_400_BAD_REQUEST)
     
     # Set new password
-    user.set_password(new_password)
-    user.save()
+    password_hashing.set_password(user, new_password)
+    user.save(update_fields=['password'])
     
     # Send email notification
     try:
@@ -644,8 +660,19 @@ def setup_2fa(request):
             'error': '2FA is already enabled for this account'
         }, status=status.HTTP_400_BAD_REQUEST)
     
-    # Generate secret key
-    secret = pyotp.random_base32()
+    qr_format = request.query_params.get('qr_format', getattr(settings, 'TWO_FACTOR_QR_FORMAT', 'png'))
+    if qr_format not in QR_FORMATS:
+        return Response({
+            'error': f"qr_format must be one of: {', '.join(QR_FORMATS)}"
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Reuse a pending secret so repeated setup calls hit the QR code cache;
+    # it is only saved to the user after verification
+    cache_key = f"temp_2fa_secret_{user.id}"
+    secret = cache.get(cache_key)
+    if secret is None:
+        secret = pyotp.random_base32()
+        cache.set(cache_key, secret, timeout=300)  # 5 minutes timeout
     
     # Create TOTP object
     totp = pyotp.TOTP(secret)
@@ -656,26 +683,9 @@ def setup_2fa(request):
         issuer_name="Prodigy Auth"
     )
     
-    # Create QR code image
-    qr = qrcode.QRCode(version=1, box_size=10, border=5)
-    qr.add_data(provisioning_uri)
-    qr.make(fit=True)
-    
-    img = qr.make_image(fill_color="black", back_color="white")
-    
-    # Convert to base64
-    buffer = io.BytesIO()
-    img.save(buffer, format='PNG')
-    buffer.seek(0)
-    qr_code_base64 = base64.b64encode(buffer.getvalue()).decode()
-    
-    # Temporarily store secret using cache (will be saved after verification)
-    cache_key = f"temp_2fa_secret_{user.id}"
-    cache.set(cache_key, secret, timeout=300)  # 5 minutes timeout
-    
     return Response({
         'secret': secret,
-        'qr_code': f"data:image/png;base64,{qr_code_base64}",
+        'qr_code': qr_codes.data_uri(provisioning_uri, qr_format),
         'manual_entry_key': secret,
         'message': 'Scan the QR code with your authenticator app, then verify with a code to enable 2FA'
     })
@@ -736,21 +746,6 @@ def verify_2fa_setup(request):
         'backup_codes': backup_codes
     })
 
-def generate_backup_codes(user, count=10):
-    """Generate backup codes for 2FA recovery"""
-    # Delete existing backup codes
-    TwoFactorBackupCode.objects.filter(user=user).delete()
-    
-    backup_codes = []
-    for _ in range(count):
-        # Generate 8-character alphanumeric code
-        code = ''.join(secrets.choice(string.ascii_uppercase + string.digits) for _ in range(8))
-        
-        TwoFactorBackupCode.objects.create(user=user, code=code)
-        backup_codes.append(code)
-    
-    return backup_codes
-
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def regenerate_backup_codes(request):
@@ -783,7 +778,7 @@ def regenerate_backup_codes(request):
 def verify_backup_code(request):
     """Verify 2FA using backup code"""
     user = request.user
-    backup_code = request.data.get('code', '').upper().strip()
+    backup_code = normalize_backup_code(request.data.get('code', ''))
     
     if not backup_code:
         return Response({
@@ -795,49 +790,34 @@ def verify_backup_code(request):
             'error': '2FA is not enabled for this account'
         }, status=status.HTTP_400_BAD_REQUEST)
     
-    # Find and verify backup code
-    try:
-        backup_code_obj = TwoFactorBackupCode.objects.get(
-            user=user,
-            code=backup_code,
-            used=False
-        )
-        
-        # Mark as used
-        backup_code_obj.mark_as_used()
-        
-        # Log backup code usage
-        log_audit_event(
-            action='2fa_backup_used',
-            user=user,
-            request=request,
-            details={'backup_code': backup_code}
-        )
-        
-        # Check remaining codes
-        remaining_codes = TwoFactorBackupCode.objects.filter(
-            user=user,
-            used=False
-        ).count()
-        
-        return Response({
-            'message': '2FA verification successful using backup code',
-            'verified': True,
-            'remaining_backup_codes': remaining_codes
-        })
-        
-    except TwoFactorBackupCode.DoesNotExist:
-        # Log failed backup code attempt
+    # Redeem the code and count what is left in one statement
+    remaining_codes = redeem_backup_code(user, backup_code)
+    
+    if remaining_codes is None:
+        # Log failed backup code attempt (codes are secrets, so never log them)
         log_security_event(
             action='2fa_backup_failed',
             user=user,
-            request=request,
-            details={'attempted_code': backup_code}
+            request=request
         )
         
         return Response({
             'error': 'Invalid or already used backup code'
         }, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Log backup code usage
+    log_audit_event(
+        action='2fa_backup_used',
+        user=user,
+        request=request,
+        details={'remaining_backup_codes': remaining_codes}
+    )
+    
+    return Response({
+        'message': '2FA verification successful using backup code',
+        'verified': True,
+        'remaining_backup_codes': remaining_codes
+    })
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
@@ -857,7 +837,7 @@ def disable_2fa(request):
         }, status=status.HTTP_400_BAD_REQUEST)
     
     # Verify current password
-    if not user.check_password(current_password):
+    if not password_hashing.check_password(user, current_password):
         return Response({
             'error': 'Current password is incorrect'
         }, status=status.HTTP_400_BAD_REQUEST)
@@ -905,34 +885,24 @@ def verify_2fa_login(request):
     
     # Try backup code first if provided
     if backup_code:
-        backup_code = backup_code.upper().strip()
-        try:
-            backup_code_obj = TwoFactorBackupCode.objects.get(
-                user=user,
-                code=backup_code,
-                used=False
-            )
-            
-            # Mark as used
-            backup_code_obj.mark_as_used()
-            
-            # Log backup code usage
-            log_audit_event(
-                action='2fa_backup_used',
-                user=user,
-                request=request,
-                details={'backup_code': backup_code}
-            )
-            
-            return Response({
-                'message': '2FA verification successful using backup code',
-                'verified': True
-            })
-            
-        except TwoFactorBackupCode.DoesNotExist:
+        remaining_codes = redeem_backup_code(user, backup_code)
+        if remaining_codes is None:
             return Response({
                 'error': 'Invalid or already used backup code'
             }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Log backup code usage
+        log_audit_event(
+            action='2fa_backup_used',
+            user=user,
+            request=request,
+            details={'remaining_backup_codes': remaining_codes}
+        )
+        
+        return Response({
+            'message': '2FA verification successful using backup code',
+            'verified': True
+        })
     
     # Verify TOTP code
     if verification_code:
@@ -981,7 +951,7 @@ def forgot_password(request):
     
     # Check if email exists in database
     try:
-        user = User.objects.get(email=email)
+        user = user_lookup.get(email=email)
         
         # Check if user is active
         if not user.is_active:
@@ -1072,15 +1042,21 @@ def reset_password(request):
             'error': 'Invalid or expired reset token'
         }, status=status.HTTP_400_BAD_REQUEST)
     
-    # Immediately delete the token to prevent reuse (SECURITY FIX)
-    cache.delete(cache_key)
-    
     try:
         user = User.objects.get(id=user_id, is_active=True)
         
-        # Set new password
-        user.set_password(new_password)
-        user.save()
+        # Hash first: HashingBusy (503, Retry-After) must leave the token
+        # usable for the retry it asks for
+        password_hashing.set_password(user, new_password)
+        
+        # Deleting the token claims it; a concurrent request that already
+        # claimed it wins, so the token can still only be used once
+        if not cache.delete(cache_key):
+            return Response({
+                'error': 'Invalid or expired reset token'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        user.save(update_fields=['password'])
         
         # Send confirmation email
         try:
@@ -1101,10 +1077,18 @@ def reset_password(request):
 @permission_classes([IsAuthenticated])
 def get_active_sessions(request):
     """Get user's active sessions"""
-    sessions = UserSession.objects.filter(
+    sessions = list(UserSession.objects.filter(
         user=request.user,
         is_active=True
-    ).order_by('-last_activity')
+    ))
+    
+    # Activity newer than the last flush is still only in the cache
+    last_seen = session_activity.last_seen([session.session_key for session in sessions])
+    for session in sessions:
+        session.last_activity = max(session.last_activity, last_seen.get(session.session_key, session.last_activity))
+    sessions.sort(key=lambda session: session.last_activity, reverse=True)
+    
+    current_session_key = request.auth.get(SESSION_ID_CLAIM) if hasattr(request.auth, 'get') else None
     
     sessions_data = []
     for session in sessions:
@@ -1114,7 +1098,7 @@ def get_active_sessions(request):
             'user_agent': session.user_agent,
             'created_at': session.created_at,
             'last_activity': session.last_activity,
-            'is_current': session.session_key == request.data.get('current_session_key')
+            'is_current': session.session_key == (current_session_key or request.data.get('current_session_key'))
         })
     
     return Response({
@@ -1141,7 +1125,7 @@ def terminate_session(request):
         )
         
         session.is_active = False
-        session.save()
+        session.save(update_fields=['is_active'])
         
         # Log session termination
         log_audit_event(
@@ -1164,7 +1148,15 @@ def terminate_session(request):
 @permission_classes([IsAuthenticated])
 def terminate_all_sessions(request):
     """Terminate all user sessions except current"""
-    current_session_key = request.data.get('current_session_key')
+    # The current session comes from the caller's own token, never the body,
+    # and must still be one of this user's active sessions
+    current_session_key = request.auth.get(SESSION_ID_CLAIM) if hasattr(request.auth, 'get') else None
+    if current_session_key and not UserSession.objects.filter(
+        user=request.user,
+        session_key=current_session_key,
+        is_active=True
+    ).exists():
+        current_session_key = None
     
     # Terminate all sessions except current
     if current_session_key:
@@ -1178,6 +1170,9 @@ def terminate_all_sessions(request):
             is_active=True
         ).update(is_active=False)
     
+    # Revoke every access and refresh token issued so far
+    bump_token_version(request.user)
+    
     # Log session termination
     log_audit_event(
         action='all_sessions_terminated',
@@ -1186,9 +1181,17 @@ def terminate_all_sessions(request):
         details={'terminated_count': terminated_count}
     )
     
-    return Response({
+    response_data = {
         'message': f'Terminated {terminated_count} sessions successfully'
-    })
+    }
+    
+    # The current session keeps working with tokens at the new version
+    if current_session_key:
+        refresh = RefreshToken.for_user(request.user, session_key=current_session_key)
+        response_data['access'] = str(refresh.access_token)
+        response_data['refresh'] = str(refresh)
+    
+    return Response(response_data)
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -1262,9 +1265,9 @@ def forgot_password_alternative(request):
     try:
         # Find user by email or username
         if email:
-            user = User.objects.get(email=email)
+            user = user_lookup.get(email=email)
         else:
-            user = User.objects.get(username=username)
+            user = user_lookup.get(username=username)
         
         # Check if user is active
         if not user.is_active:
@@ -1281,8 +1284,8 @@ def forgot_password_alternative(request):
             temp_password = ''.join(secrets.choice(string.ascii_letters + string.digits) for _ in range(12))
             
             # Set temporary password
-            user.set_password(temp_password)
-            user.save()
+            password_hashing.set_password(user, temp_password)
+            user.save(update_fields=['password'])
             
             # Send temporary password via email
             try:
@@ -1333,7 +1336,7 @@ def forgot_password_username_only(request):
         }, status=status.HTTP_400_BAD_REQUEST)
     
     try:
-        user = User.objects.get(username=username)
+        user = user_lookup.get(username=username)
         
         # Check if user is active
         if not user.is_active:
@@ -1345,8 +1348,8 @@ def forgot_password_username_only(request):
         temp_password = ''.join(secrets.choice(string.ascii_letters + string.digits) for _ in range(12))
         
         # Set temporary password
-        user.set_password(temp_password)
-        user.save()
+        password_hashing.set_password(user, temp_password)
+        user.save(update_fields=['password'])
         
         # Send temporary password via email
         try:
@@ -8,6 +8,8 @@ const AdminPanel = () => {
   const { isAdmin, user } = useAuth();
   const [stats, setStats] = useState(null);
   const [users, setUsers] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMoreUsers, setLoadingMoreUsers] = useState(false);
   const [recentUsers, setRecentUsers] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
@@ -31,6 +33,7 @@ const AdminPanel = () => {
       setStats(dashboardResponse.data.stats);
       setRecentUsers(dashboardResponse.data.recent_users || []);
       setUsers(usersResponse.data.users || []);
+      setNextCursor(usersResponse.data.has_more ? usersResponse.data.next_cursor : null);
       setError('');
     } catch (error) {
       setError('Failed to fetch admin data');
@@ -40,6 +43,22 @@ const AdminPanel = () => {
     }
   };
 
+  const loadMoreUsers = async () => {
+    if (!nextCursor) return;
+
+    setLoadingMoreUsers(true);
+    try {
+      const response = await axios.get('/api/auth/admin/users/', { params: { cursor: nextCursor } });
+      setUsers(prev => [...prev, ...(response.data.users || [])]);
+      setNextCursor(response.data.has_more ? response.data.next_cursor : null);
+    } catch (error) {
+      alert('Failed to load more users');
+      console.error('Load more users error:', error);
+    } finally {
+      setLoadingMoreUsers(false);
+    }
+  };
+
   const setUserActionLoading = (userId, action, loading) => {
     setActionLoading(prev => ({
       ...prev,
@@ -328,7 +347,9 @@ const AdminPanel = () => {
       {/* Users Management Tab */}
       {activeTab === 'users' && (
         <div className="dashboard-card">
-          <h3 style={{ marginBottom: '20px' }}>User Management ({users.length} users)</h3>
+          <h3 style={{ marginBottom: '20px' }}>
+            User Management ({nextCursor ? `showing ${users.length} of ${stats?.total_users ?? `${users.length}+`}` : users.length} users)
+          </h3>
           
           <div style={{ overflowX: 'auto' }}>
             <table style={{ width: '100%', borderCollapse: 'collapse' }}>
@@ -478,6 +499,18 @@ const AdminPanel = () => {
               </tbody>
             </table>
           </div>
+
+          {nextCursor && (
+            <div style={{ textAlign: 'center', marginTop: '20px' }}>
+              <button onClick={loadMoreUsers} disabled={loadingMoreUsers} className="btn btn-secondary">
+                {loadingMoreUsers ? (
+                  <RefreshCw size={16} className="spinning" />
+                ) : (
+                  'Load more users'
+                )}
+              </button>
+            </div>
+          )}
         </div>
       )}
 
@@ -1,4 +1,5 @@
 import os
+import sys
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
@@ -9,6 +10,8 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = os.getenv('SECRET_KEY', 'django-insecure-supersecretkeychangeme')
 DEBUG = True
+# The test runner forces DEBUG off but still runs in a single process
+TESTING = sys.argv[1:2] == ['test']
 ALLOWED_HOSTS = ['*']
 
 INSTALLED_APPS = [
@@ -32,6 +35,7 @@ MIDDLEWARE = [
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'accounts.middleware.RateLimitMiddleware',  # Add rate limiting
+    'accounts.middleware.SessionActivityMiddleware',  # Track UserSession.last_activity
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -64,6 +68,28 @@ DATABASES = {
     }
 }
 
+# Cache
+# Rate limits, login throttles, failed-login counters, token versions and
+# revocations all live in the cache, so every worker process must share it.
+# Set REDIS_URL for any multi-process deployment (pip install redis); the
+# per-process local-memory cache is only safe for the development server.
+# accounts.checks refuses it when DEBUG is off outside the test runner
+# (accounts.E001).
+REDIS_URL = os.getenv('REDIS_URL', '')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -84,19 +110,29 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # DRF + JWT Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.TokenVersionJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # orjson-backed; fall back to DRF's stdlib JSON when orjson is not installed
+    'DEFAULT_RENDERER_CLASSES': [
+        'accounts.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'accounts.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
-    'UPDATE_LAST_LOGIN': True,
+    'UPDATE_LAST_LOGIN': False,  # login_view records last_login itself (accounts/login.py)
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
     'VERIFYING_KEY': None,
@@ -105,6 +141,7 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
     'TOKEN_TYPE_CLAIM': 'token_type',
+    'TOKEN_REFRESH_SERIALIZER': 'accounts.serializers.CustomTokenRefreshSerializer',
 }
 
 # CORS Configuration
@@ -165,4 +202,79 @@ else:
 EMAIL_VERIFICATION_TIMEOUT = 24 * 60 * 60  # 24 hours in seconds
 
 # Rate Limiting Settings
-RATELIMIT_ENABLE = False  # Temporarily disable for testing
\ No newline at end of file
+RATELIMIT_ENABLE = False  # Temporarily disable for testing
+
+# Transactional Email Outbox
+EMAIL_OUTBOX_ENABLED = True  # Queue emails for `manage.py process_email_outbox`
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5  # Dead-letter after this many failed deliveries
+EMAIL_OUTBOX_RETRY_BACKOFF = 60  # Base retry delay in seconds (doubles per attempt)
+EMAIL_OUTBOX_MAX_BACKOFF = 60 * 60  # Cap retry delay at 1 hour
+EMAIL_OUTBOX_LEASE_SECONDS = 5 * 60  # Reclaim messages stuck in 'sending' after 5 minutes
+EMAIL_OUTBOX_RETENTION = 7 * 24 * 60 * 60  # Delete sent and dead-lettered messages after 7 days
+EMAIL_OUTBOX_PURGE_INTERVAL = 60 * 60  # Run the outbox purge hourly
+
+
+# SMTP Connection Pool
+EMAIL_POOL_SIZE = 4  # Maximum open SMTP connections per process
+EMAIL_POOL_IDLE_TIMEOUT = 60  # Close pooled connections idle for more than 60 seconds
+
+# Audit Logging
+AUDIT_LOG_MODE = 'buffered'  # 'buffered' batches routine events; 'sync' writes every event immediately
+AUDIT_LOG_BUFFER_SIZE = 10000  # Events held in memory before new ones are dropped
+AUDIT_LOG_FLUSH_SIZE = 100  # Flush as soon as this many events are waiting
+AUDIT_LOG_FLUSH_INTERVAL = 2  # Flush at least every 2 seconds
+# AUDIT_LOG_SYNC_ACTIONS = [...]  # Override actions always written synchronously (see accounts/audit.py)
+
+# Password Hashing Pool
+HASHING_MAX_WORKERS = os.cpu_count() or 2  # Concurrent password hashes per process
+HASHING_MAX_QUEUE = 32  # Hash requests allowed to wait before answering 503
+HASHING_RETRY_AFTER = 2  # Retry-After seconds sent with the 503
+
+# Token Revocation
+TOKEN_REVOCATION_BLOOM_CAPACITY = 100000  # Blacklisted JTIs before the filter is resized
+TOKEN_REVOCATION_BLOOM_ERROR_RATE = 0.001  # False positives fall through to a database check
+TOKEN_REVOCATION_SYNC_INTERVAL = 5  # Max seconds before another process's revocations are seen
+TOKEN_REVOCATION_REBUILD_INTERVAL = 60 * 60  # Rebuild hourly to drop expired JTIs
+TOKEN_VERSION_CACHE_TTL = 60  # Seconds a cached token_version is trusted before the user row is re-read
+
+# Periodic Maintenance Jobs
+PERIODIC_JOBS_ENABLED = True  # Run maintenance jobs on a background thread in web processes
+TOKEN_PURGE_INTERVAL = 60 * 60  # Purge expired outstanding/blacklisted tokens hourly
+TOKEN_PURGE_BATCH_SIZE = 1000  # Tokens deleted per transaction
+TOKEN_PURGE_BATCH_PAUSE = 0.05  # Seconds between batches so other writers get the lock
+SESSION_ACTIVITY_FLUSH_INTERVAL = 60  # Write UserSession.last_activity at most once a minute per session
+SESSION_REAPER_INTERVAL = 60 * 60  # Expire and archive stale sessions hourly
+SESSION_REAPER_BATCH_SIZE = 1000  # Sessions handled per batch
+SESSION_REAPER_BATCH_PAUSE = 0.05  # Seconds between batches
+SESSION_ARCHIVE_AFTER_DAYS = 30  # Inactive sessions stay in UserSession this long before archiving
+
+# Admin Dashboard
+DASHBOARD_STATS_CACHE_TTL = 30  # Seconds to serve cached user counters
+
+# Query Budgets
+LOGIN_QUERY_BUDGET = 4  # SELECT user, UPDATE user, INSERT outstanding token, INSERT session
+QUERY_BUDGET_STRICT = False  # Raise instead of logging when a budget is exceeded (enable in tests)
+
+# Two-Factor QR Codes
+TWO_FACTOR_QR_FORMAT = 'png'  # Default setup_2fa image: 1-bit PNG (smallest) or 'svg' (scalable)
+QR_PNG_SCALE = 4  # Pixels per module in PNG codes
+QR_RENDER_MAX_WORKERS = 2  # Concurrent QR renders per process
+QR_CACHE_TIMEOUT = 300  # Matches the pending 2FA secret window
+
+# Login Throttling (checked before the user lookup and password hash; independent of RATELIMIT_ENABLE)
+LOGIN_THROTTLE_ENABLED = True
+LOGIN_THROTTLE_TRUSTED_PROXIES = 0  # Reverse proxies in front of the app; 0 keys on REMOTE_ADDR, N on the Nth X-Forwarded-For entry from the right
+LOGIN_THROTTLE_RATES = {
+    'ip': (50, 300),  # Attempts per client IP per 5 minutes
+    'network': (200, 300),  # Per /24 (IPv4) or /64 (IPv6)
+    'account': (10, 300),  # Per normalized target email, from any address
+}
+
+# Failed Login Tracking
+FAILED_LOGIN_FLUSH_INTERVAL = 30  # Seconds between writes of cached failed-attempt counts to CustomUser
+FAILED_LOGIN_COUNTER_TTL = 24 * 60 * 60  # Idle counters expire; the flushed column is the fallback
+
+# User Lookup Cache
+USER_LOOKUP_CACHE_TTL = 60  # Seconds a user found by email/username stays cached
+USER_LOOKUP_NEGATIVE_TTL = 30  # Seconds an unknown email/username stays cached as missing
+AUTH_USER_CACHE_TTL = 300  # Seconds an authenticated user stays cached by id (versioned by token_version)
\ No newline at end of file